@@ -2,7 +2,9 @@ from parser.file_selector import select_file
 from parser.parser import Parser
 from serializer.serializer import SolutionSerializer
 from scheduler.beam_search_scheduler import BeamSearchScheduler
-from utils.utils import Utils
+from utils.instance_index import InstanceIndex
+from validator.exceptions.constraint_exception import ConstraintException
+from validator.solution_validator import SolutionValidator
 import argparse
 import sys
 
@@ -10,6 +12,24 @@ import sys
 def main():
     parser_arg = argparse.ArgumentParser(description="Run TV scheduling algorithms")
     parser_arg.add_argument("--input", "-i", dest="input_file", help="Path to input JSON (optional)")
+    parser_arg.add_argument("--search", choices=BeamSearchScheduler.SEARCH_MODES, default="best",
+                            help="Search strategy: best of beam and frontier, lock-step beam, "
+                                 "time-ordered frontier or rolling horizon")
+    parser_arg.add_argument("--bucket-width", type=int, default=None,
+                            help="States kept per time point in frontier search (default: beam width / 10)")
+    parser_arg.add_argument("--horizon-window", type=int, default=1440,
+                            help="Window length in minutes for rolling-horizon search")
+    parser_arg.add_argument("--horizon-commit", type=int, default=720,
+                            help="Minutes committed from each rolling-horizon window")
+    parser_arg.add_argument("--workers", type=int, default=1,
+                            help="Worker processes for solving the day in parts split at forced cut points")
+    parser_arg.add_argument("--local-search-time", type=float, default=10.0,
+                            help="Time limit in seconds backing up the local search's pass cap (0: greedy refill)")
+    parser_arg.add_argument("--lns-time", type=float, default=0.0,
+                            help="Seconds of large-neighborhood search after the local search, "
+                                 "followed by a second local-search pass (0: off)")
+    parser_arg.add_argument("--lns-window", type=int, default=240,
+                            help="Longest window in minutes destroyed and re-solved per LNS step")
     
     args = parser_arg.parse_args()
 
@@ -21,7 +41,7 @@ def main():
 
     parser = Parser(file_path)
     instance = parser.parse()
-    Utils.set_current_instance(instance)
+    index = InstanceIndex(instance)
 
     print("\nOpening time:", instance.opening_time)
     print("Closing time:", instance.closing_time)
@@ -32,19 +52,33 @@ def main():
     # Default optimized parameters
     beam_width = 100
     lookahead = 4
-    percentile = 25
     
     scheduler = BeamSearchScheduler(
         instance_data=instance,
         beam_width=beam_width,
         lookahead_limit=lookahead,
-        density_percentile=percentile,
-        verbose=False
+        verbose=False,
+        index=index,
+        search_mode=args.search,
+        bucket_width=args.bucket_width,
+        horizon_window=args.horizon_window,
+        horizon_commit=args.horizon_commit,
+        workers=args.workers,
+        local_search_time=args.local_search_time,
+        lns_time=args.lns_time,
+        lns_window=args.lns_window
     )
 
     solution = scheduler.generate_solution()
     print(f"\n[OK] Generated solution with total score: {solution.total_score}")
 
+    try:
+        SolutionValidator(index).validate(solution)
+    except ConstraintException as e:
+        print(f"[ERROR] Solution failed validation: {e}")
+        sys.exit(1)
+    print("[OK] Solution passed validation")
+
     algorithm_name = type(scheduler).__name__.lower()
     serializer = SolutionSerializer(input_file_path=file_path, algorithm_name=algorithm_name)
     serializer.serialize(solution)
@@ -7,20 +7,58 @@ from models.instance_data import InstanceData
 from models.solution import Solution
 from models.schedule import Schedule
 from models.program import Program
-from utils.utils import Utils
+from scheduler.decomposition_planner import DecompositionPlanner
+from scheduler.large_neighborhood_search import LargeNeighborhoodSearch
+from scheduler.local_search import NeighborhoodSearch
+from utils.instance_index import InstanceIndex
 
 
 class BeamSearchScheduler:
 
+    SEARCH_MODES = ("best", "beam", "frontier", "rolling")
+
     def __init__(self, instance_data: InstanceData, 
                  beam_width: int = 50,
                  lookahead_limit: int = 4,
-                 density_percentile: int = 25,
-                 verbose: bool = True):
+                 verbose: bool = True,
+                 search_mode: str = "best",
+                 bucket_width: Optional[int] = None,
+                 horizon_window: int = 1440,
+                 horizon_commit: int = 720,
+                 workers: int = 1,
+                 local_search_time: float = 10.0,
+                 lns_time: float = 0.0,
+                 lns_window: int = 240,
+                 index: Optional[InstanceIndex] = None):
+        if search_mode not in self.SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{search_mode}' (expected one of {', '.join(self.SEARCH_MODES)})")
         self.instance_data = instance_data
+        self.index = index if index is not None else InstanceIndex(instance_data)
         self.beam_width = beam_width
+        # "best": run both "beam" and "frontier" and keep the better schedule;
+        # the two lose different schedules to pruning.
+        # "beam": lock-step iterations over states at mixed times.
+        # "frontier": states grouped by decision time and expanded chronologically,
+        # keeping at most bucket_width states per time point.
+        # "rolling": frontier search over horizon_window-minute windows, committing
+        # the first horizon_commit minutes of each before moving on.
+        self.search_mode = search_mode
+        self.bucket_width = bucket_width
+        self.horizon_window = max(horizon_window, instance_data.min_duration)
+        self.horizon_commit = min(max(horizon_commit, 1), self.horizon_window)
+        # > 1: split the day at forced cut points and solve the parts in that
+        # many worker processes (see DecompositionPlanner)
+        self.workers = workers
+        # Time limit in seconds backing up the pass cap of the neighborhood local
+        # search after the search phase (see NeighborhoodSearch); 0 falls back
+        # to the greedy-refill local search
+        self.local_search_time = local_search_time
+        # Seconds of destroy-and-repair with annealing acceptance after the local
+        # search, followed by a second local-search pass, re-solving windows of
+        # up to lns_window minutes (see LargeNeighborhoodSearch); 0 disables it
+        self.lns_time = lns_time
+        self.lns_window = lns_window
         self.lookahead_limit = lookahead_limit
-        self.density_percentile = density_percentile
         self.verbose = verbose
         self.min_d = instance_data.min_duration
         
@@ -30,9 +68,9 @@ class BeamSearchScheduler:
         """Build all necessary indices."""
         self.n_channels = len(self.instance_data.channels)
         
-        # Programs sorted by start time per channel
-        self.ch_progs: List[List[Program]] = []
-        self.ch_starts: List[List[int]] = []
+        # Programs sorted by start time per channel (shared, read-only)
+        self.ch_progs = self.index.programs_by_channel
+        self.ch_starts = self.index.program_starts
         
         # Program lookup
         self.prog_by_id: Dict[str, Tuple[Program, int]] = {}
@@ -44,16 +82,16 @@ class BeamSearchScheduler:
         all_times = set()
         all_times.add(self.instance_data.opening_time)
         
-        for ch_idx, channel in enumerate(self.instance_data.channels):
-            progs = sorted(channel.programs, key=lambda p: p.start)
-            self.ch_progs.append(progs)
-            self.ch_starts.append([p.start for p in progs])
-            
+        for ch_idx, progs in enumerate(self.ch_progs):
             for prog in progs:
                 all_times.add(prog.start)
                 all_times.add(prog.end)
                 self.prog_by_id[prog.unique_id] = (prog, ch_idx)
                 self.starts_at[prog.start].append((prog, ch_idx))
+
+        # One bit per program: search states carry the programs they used as an
+        # int bitmask, so extending a state never copies a set
+        self.prog_bit: Dict[str, int] = {uid: 1 << i for i, uid in enumerate(self.prog_by_id)}
         
         # Filter to valid range
         self.times = sorted([t for t in all_times 
@@ -80,6 +118,7 @@ class BeamSearchScheduler:
         
         # Precompute forbidden intervals for O(1) checks
         self.forbidden_prefix = []
+        self.forbidden_minutes: List[List[int]] = []
         self.has_priority_blocks = bool(self.instance_data.priority_blocks)
         
         if self.has_priority_blocks:
@@ -99,32 +138,141 @@ class BeamSearchScheduler:
                     curr += is_forbidden[t]
                     prefix[t+1] = curr
                 self.forbidden_prefix.append(prefix)
+                self.forbidden_minutes.append([t for t in range(max_t) if is_forbidden[t]])
         
         # Time preference index for faster lookup
         self.prefs = self.instance_data.time_preferences
+        self.prefs_by_genre: Dict[str, list] = defaultdict(list)
+        for pref in self.prefs:
+            self.prefs_by_genre[pref.preferred_genre].append(pref)
+        # Preferences a segment of each program could earn (same genre, overlapping
+        # the program by at least min_d), in declaration order.  Keeps bonus lookups
+        # independent of how many preference windows a long horizon has.
+        self.prog_prefs: Dict[str, tuple] = {}
+        for progs in self.ch_progs:
+            for prog in progs:
+                self.prog_prefs[prog.unique_id] = tuple(
+                    pref for pref in self.prefs_by_genre.get(prog.genre, ())
+                    if min(prog.end, pref.end) - max(prog.start, pref.start) >= self.min_d
+                )
+
+        # Candidate end times per program: every decision point strictly inside
+        # the program plus its (closing-clamped) natural end.  The per-start
+        # option lists derived from these are memoised in _end_options.
+        closing = self.instance_data.closing_time
+        self.prog_end_points: Dict[str, Tuple[int, ...]] = {}
+        for progs in self.ch_progs:
+            for prog in progs:
+                nat_end = min(prog.end, closing)
+                lo = bisect.bisect_right(self.times, prog.start)
+                hi = bisect.bisect_left(self.times, nat_end)
+                self.prog_end_points[prog.unique_id] = tuple(self.times[lo:hi]) + (nat_end,)
+        self._end_option_cache: Dict[Tuple[str, int], Tuple[Tuple[int, int], ...]] = {}
+
+        # Admissible heuristic: best achievable score from each minute to closing
+        self._build_upper_bound()
 
-        # Calculate average score per minute for heuristics
-        # IMPROVED: Use top 25% of programs to get a more realistic "good" density
-        # This prevents the scheduler from wasting time on low-value gaps
-        densities = []
-        for ch in self.instance_data.channels:
-            for p in ch.programs:
-                dur = p.end - p.start
-                if dur > 0:
-                    densities.append(p.score / dur)
-        
-        densities.sort(reverse=True)
-        if densities:
-            # Take top N% based on density_percentile
-            # Lower percentile = More optimistic (expects higher scores)
-            # Higher percentile = More conservative
-            top_n = max(1, int(len(densities) * (self.density_percentile / 100.0)))
-            self.avg_score_per_min = sum(densities[:top_n]) / top_n
-        else:
-            self.avg_score_per_min = 1.0
-            
         if self.verbose:
-            print(f"Average score density (top {self.density_percentile}%): {self.avg_score_per_min:.4f} pts/min")
+            print(f"Upper bound from opening: {self._upper_bound(self.instance_data.opening_time)} pts")
+
+    def _build_upper_bound(self):
+        """
+        Precompute ub[c][t]: an upper bound on the score obtainable in
+        [t, closing) when the previous segment was on channel index c, plus
+        ub_free[t] for the empty schedule (no switch penalty possible).
+
+        Computed backwards per minute, relaxing the genre and used-program
+        constraints (priority blocks and the switch penalty are respected):
+
+            val_c(t)    = best segment on channel c starting at t + ub[c][end]
+            ub[c][t]    = max(ub[c][t+1], val_c(t), max_c' val_c'(t) - switch)
+            ub_free[t]  = max(ub_free[t+1], max_c' val_c'(t))
+
+        A segment either runs to its program's natural end or stops early;
+        since ub is non-increasing in t, stopping at t + min_d bounds every
+        early stop.  After an early stop the program can't be re-joined, so
+        the follow-up either switches channel or waits for the program's end.
+        Segments take the best reachable preference bonus.
+        """
+        opening = self.instance_data.opening_time
+        closing = self.instance_data.closing_time
+        term_pen = self.instance_data.termination_penalty
+        switch_pen = self.instance_data.switch_penalty
+        min_d = self.min_d
+        span = closing - opening
+
+        ub = [[0] * (span + 1) for _ in range(self.n_channels)]
+        ub_free = [0] * (span + 1)
+        ptrs = [len(progs) - 1 for progs in self.ch_progs]
+        NONE = float("-inf")
+        vals = [NONE] * self.n_channels
+
+        for t in range(closing - 1, opening - 1, -1):
+            ti = t - opening
+            best_any = NONE
+            for ch_idx, progs in enumerate(self.ch_progs):
+                vals[ch_idx] = NONE
+                # Program running at t (same rule as _get_prog), walking backwards
+                i = ptrs[ch_idx]
+                while i >= 0 and progs[i].start > t:
+                    i -= 1
+                ptrs[ch_idx] = i
+                if i < 0:
+                    continue
+                prog = progs[i]
+                nat_end = min(prog.end, closing)
+                if prog.end <= t or nat_end - t < min_d:
+                    continue
+
+                ch_ub = ub[ch_idx]
+                base = prog.score + self._max_bonus(prog, t, nat_end)
+                if t > prog.start:
+                    base -= term_pen
+
+                value = NONE
+                if self._channel_allowed(ch_idx, t, nat_end):
+                    value = base + ch_ub[nat_end - opening]
+                    if nat_end < prog.end:
+                        value -= term_pen
+
+                # After an early stop the same program can't be re-entered: either
+                # switch channel (paying the penalty) or wait for its natural end
+                early_end = t + min_d
+                if early_end < nat_end and self._channel_allowed(ch_idx, t, early_end):
+                    after = max(ub_free[early_end - opening] - switch_pen, ch_ub[nat_end - opening])
+                    value = max(value, base - term_pen + after)
+
+                vals[ch_idx] = value
+                if value > best_any:
+                    best_any = value
+
+            switched = best_any - switch_pen
+            for ch_idx in range(self.n_channels):
+                nxt = ub[ch_idx][ti + 1]
+                best = vals[ch_idx] if vals[ch_idx] > switched else switched
+                ub[ch_idx][ti] = best if best > nxt else nxt
+            ub_free[ti] = best_any if best_any > ub_free[ti + 1] else ub_free[ti + 1]
+
+        self.ub = ub
+        self.ub_free = ub_free
+        self.ch_index = {ch.channel_id: idx for idx, ch in enumerate(self.instance_data.channels)}
+
+    def _max_bonus(self, prog: Program, seg_start: int, seg_end: int) -> int:
+        """Largest preference bonus any segment inside [seg_start, seg_end) can earn."""
+        bonus = 0
+        for pref in self.prog_prefs[prog.unique_id]:
+            if min(seg_end, pref.end) - max(seg_start, pref.start) >= self.min_d:
+                bonus = max(bonus, pref.bonus)
+        return bonus
+
+    def _upper_bound(self, time: int, prev_ch_id: Optional[int] = None) -> int:
+        """Admissible estimate of the score still obtainable from ``time``."""
+        if time >= self.instance_data.closing_time:
+            return 0
+        ti = max(time, self.instance_data.opening_time) - self.instance_data.opening_time
+        if prev_ch_id is None:
+            return self.ub_free[ti]
+        return self.ub[self.ch_index[prev_ch_id]][ti]
     
     def _get_prog(self, ch_idx: int, time: int) -> Optional[Program]:
         """Get program at time on channel (binary search)."""
@@ -155,6 +303,63 @@ class BeamSearchScheduler:
         count = prefix[e] - prefix[s]
         return count == 0
     
+    def _pref_bonus(self, prog: Program, seg_start: int, seg_end: int) -> int:
+        """Bonus of the first preference the segment overlaps by at least min_d."""
+        for pref in self.prog_prefs[prog.unique_id]:
+            if min(seg_end, pref.end) - max(seg_start, pref.start) >= self.min_d:
+                return pref.bonus
+        return 0
+
+    def _end_options(self, prog: Program, ch_idx: int, seg_start: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        Non-dominated (seg_end, score) options for watching ``prog`` from
+        ``seg_start``, with scores excluding the switch penalty.
+
+        Ends are min_d after the start, every decision point inside the
+        program and its natural end, cut at the first minute a priority block
+        forbids the channel.  An option is dominated, and dropped, when an
+        earlier end already scores at least as much as this one plus the
+        upper bound of everything that could follow it.  Results depend only
+        on (program, start) and are computed once.
+        """
+        key = (prog.unique_id, seg_start)
+        options = self._end_option_cache.get(key)
+        if options is not None:
+            return options
+
+        min_end = seg_start + self.min_d
+        nat_end = min(prog.end, self.instance_data.closing_time)
+        limit = nat_end
+        if self.has_priority_blocks:
+            forbidden = self.forbidden_minutes[ch_idx]
+            i = bisect.bisect_left(forbidden, seg_start)
+            if i < len(forbidden):
+                limit = min(limit, forbidden[i])
+
+        options = []
+        if min_end <= limit:
+            points = self.prog_end_points[prog.unique_id]
+            ends = [min_end]
+            ends.extend(points[bisect.bisect_right(points, min_end):bisect.bisect_right(points, limit)])
+
+            term_pen = self.instance_data.termination_penalty
+            ch_id = self.instance_data.channels[ch_idx].channel_id
+            base = prog.score - (term_pen if seg_start > prog.start else 0)
+            best = None
+            for seg_end in ends:
+                score = base + self._pref_bonus(prog, seg_start, seg_end)
+                if seg_end < prog.end:
+                    score -= term_pen
+                if best is not None and best >= score + self._upper_bound(seg_end, ch_id):
+                    continue
+                options.append((seg_end, score))
+                if best is None or score > best:
+                    best = score
+
+        options = tuple(options)
+        self._end_option_cache[key] = options
+        return options
+
     def _calc_score(self, prog: Program, ch_idx: int, 
                     seg_start: int, seg_end: int,
                     prev_ch_id: Optional[int]) -> int:
@@ -180,14 +385,7 @@ class BeamSearchScheduler:
         # Time preference bonus
         # Per PDF: "the program must fall within the preferred interval with at least D"
         # This means we check if the SCHEDULED SEGMENT overlaps the preference by >= D
-        for pref in self.prefs:
-            if prog.genre == pref.preferred_genre:
-                # Check overlap between our SEGMENT and the preference window
-                ov_start = max(seg_start, pref.start)
-                ov_end = min(seg_end, pref.end)
-                if ov_end - ov_start >= self.min_d:
-                    score += pref.bonus
-                    break  # Only one bonus per preference match
+        score += self._pref_bonus(prog, seg_start, seg_end)
         
         # Switch penalty
         if prev_ch_id is not None and prev_ch_id != channel.channel_id:
@@ -205,17 +403,27 @@ class BeamSearchScheduler:
     
     def _get_candidates(self, time: int, prev_ch_id: Optional[int],
                         prev_genre: str, genre_streak: int,
-                        used_progs: Set[str]) -> List[Tuple[int, int, int, Program, int, int]]:
+                        used_mask: int,
+                        horizon_end: Optional[int] = None,
+                        within_horizon: bool = False) -> List[Tuple[int, int, int, Program, int, int]]:
         """
         Get all valid segment candidates starting from current time.
         
         KEY INSIGHT: We can join a program that's already in progress (late start)!
         The program just needs to still be running at 'time'.
+
+        ``used_mask`` is the bitmask (see prog_bit) of programs already
+        watched.  ``horizon_end`` stops the lookahead at the end of a search
+        window so no candidate starts outside it; with ``within_horizon`` no
+        candidate ends after it either.
         
         Returns: List of (score, ch_idx, ch_id, prog, seg_start, seg_end)
         """
         candidates = []
         closing = self.instance_data.closing_time
+        lookahead_end = closing if horizon_end is None else min(closing, horizon_end)
+        switch_pen = self.instance_data.switch_penalty
+        prog_bit = self.prog_bit
         
         for ch_idx in range(self.n_channels):
             channel = self.instance_data.channels[ch_idx]
@@ -227,7 +435,7 @@ class BeamSearchScheduler:
                 continue
             
             # Skip if we already used this exact program
-            if prog.unique_id in used_progs:
+            if used_mask & prog_bit[prog.unique_id]:
                 continue
             
             # Genre constraint
@@ -235,46 +443,13 @@ class BeamSearchScheduler:
             if new_streak > self.instance_data.max_consecutive_genre:
                 continue
             
-            # The segment starts at current time (late start if time > prog.start)
-            seg_start = time
-            
-            # Try different end times
-            end_options = set()
-            
-            # Option 1: Natural program end
-            nat_end = min(prog.end, closing)
-            if nat_end - seg_start >= self.min_d:
-                end_options.add(nat_end)
-            
-            # Option 2: Early stops at program boundaries
-            # Optimize: Use bisect to find relevant times
-            start_idx = bisect.bisect_right(self.times, seg_start + self.min_d)
-            end_idx = bisect.bisect_left(self.times, nat_end)
-            
-            for i in range(start_idx, end_idx + 1):
-                if i >= len(self.times):
-                    break
-                t = self.times[i]
-                if t > nat_end:
+            # The segment starts at current time (late start if time > prog.start);
+            # end options and their scores are precomputed per (program, start)
+            switch = switch_pen if prev_ch_id is not None and prev_ch_id != ch_id else 0
+            for seg_end, score in self._end_options(prog, ch_idx, time):
+                if within_horizon and seg_end > lookahead_end:
                     break
-                end_options.add(t)
-            
-            # Option 3: End at exact min_duration
-            min_end = seg_start + self.min_d
-            if min_end <= nat_end:
-                end_options.add(min_end)
-            
-            for seg_end in sorted(end_options):
-                if seg_end > closing:
-                    continue
-                
-                # Check priority blocks for the segment
-                if not self._channel_allowed(ch_idx, seg_start, seg_end):
-                    continue
-                
-                score = self._calc_score(prog, ch_idx, seg_start, seg_end, prev_ch_id)
-                if score > -999999:
-                    candidates.append((score, ch_idx, ch_id, prog, seg_start, seg_end))
+                candidates.append((score - switch, ch_idx, ch_id, prog, time, seg_end))
         
         # Also try looking ahead for future programs that might offer better value
         # This helps when current time has no good options but a program starts soon
@@ -284,7 +459,7 @@ class BeamSearchScheduler:
         
         for i in range(start_idx, len(self.times)):
             future_time = self.times[i]
-            if future_time >= closing:
+            if future_time >= lookahead_end:
                 break
             # Don't look too far ahead (performance)
             if future_time > time + self.min_d * self.lookahead_limit:
@@ -299,7 +474,7 @@ class BeamSearchScheduler:
                 channel = self.instance_data.channels[ch_idx]
                 ch_id = channel.channel_id
                 
-                if prog.unique_id in used_progs:
+                if used_mask & prog_bit[prog.unique_id]:
                     continue
                 
                 # Only consider if this is a program START (not late join)
@@ -309,7 +484,7 @@ class BeamSearchScheduler:
                 if new_streak > self.instance_data.max_consecutive_genre:
                     continue
                 
-                nat_end = min(prog.end, closing)
+                nat_end = min(prog.end, lookahead_end if within_horizon else closing)
                 if nat_end - future_time < self.min_d:
                     continue
                 
@@ -323,19 +498,89 @@ class BeamSearchScheduler:
         
         return candidates
     
+    def _greedy_incumbent(self, start: Optional[tuple] = None,
+                          horizon_end: Optional[int] = None,
+                          within_horizon: bool = False) -> Tuple[int, list]:
+        """
+        Single greedy rollout guided by the upper bound; gives branch-and-bound
+        an incumbent before the beam completes any schedule.
+
+        ``start`` is an optional (time, prev_ch_id, prev_genre, genre_streak,
+        used_mask) boundary state and ``horizon_end`` an optional end of the
+        window to fill (defaults: opening time, empty state, closing time);
+        ``within_horizon`` keeps the last segment from running past it.
+        """
+        closing = horizon_end if horizon_end is not None else self.instance_data.closing_time
+        if start is None:
+            start = (self.instance_data.opening_time, None, "", 0, 0)
+        time, prev_ch, prev_genre, g_streak, used = start
+        score, sched = 0, []
+
+        while time < closing:
+            candidates = self._get_candidates(time, prev_ch, prev_genre, g_streak, used, closing, within_horizon)
+            if not candidates:
+                idx = bisect.bisect_right(self.times, time)
+                if idx >= len(self.times) or self.times[idx] >= closing:
+                    break
+                time = self.times[idx]
+                continue
+            seg_score, ch_idx, ch_id, prog, seg_start, seg_end = max(
+                candidates, key=lambda x: x[0] + self._upper_bound(x[5], x[2])
+            )
+            sched.append((prog.unique_id, ch_id, seg_start, seg_end, seg_score))
+            score += seg_score
+            used |= self.prog_bit[prog.unique_id]
+            g_streak = 1 if prog.genre != prev_genre else g_streak + 1
+            prev_ch, prev_genre, time = ch_id, prog.genre, seg_end
+
+        return score, sched
+
+    @staticmethod
+    def _link(segments: list, node: Optional[tuple] = None) -> Optional[tuple]:
+        """Append ``segments`` to the schedule ``node`` (see _materialize)."""
+        for seg in segments:
+            node = (node, seg)
+        return node
+
+    @staticmethod
+    def _materialize(node: Optional[tuple]) -> list:
+        """
+        Segment list of a schedule node.
+
+        Search states share their schedule prefixes: a node is
+        (parent_node, (prog_id, ch_id, start, end, seg_score)), None being
+        the empty schedule, so extending a state costs O(1) instead of
+        copying the whole partial schedule.
+        """
+        segments = []
+        while node is not None:
+            node, seg = node
+            segments.append(seg)
+        segments.reverse()
+        return segments
+
     def _beam_search_core(self) -> Solution:
         """
         Core beam search algorithm.
         Deterministic version.
+
+        States are ranked by score + upper bound of the remaining time and
+        any state or candidate whose bound cannot beat the incumbent (best
+        complete schedule so far) is dropped (branch-and-bound).
         """
         opening = self.instance_data.opening_time
         closing = self.instance_data.closing_time
+        ub = self._upper_bound
+        
+        prog_bit = self.prog_bit
         
-        # State: (score, time, prev_ch_id, prev_genre, genre_streak, schedule_tuple, used_set_tuple)
-        initial = (0, opening, None, "", 0, tuple(), frozenset())
+        # State: (score, time, prev_ch_id, prev_genre, genre_streak, schedule_node, used_mask)
+        initial = (0, opening, None, "", 0, None, 0)
         beam = [initial]
         
-        best_solution = (0, [])
+        best_score, best_sched = self._greedy_incumbent()
+        best_solution = (best_score, self._link(best_sched))
+        self.states_expanded = 0
         
         iterations = 0
         max_iterations = 5000  # Safety limit
@@ -345,13 +590,18 @@ class BeamSearchScheduler:
             next_beam = []
             
             for state in beam:
-                score, time, prev_ch, prev_genre, g_streak, sched_tuple, used = state
+                score, time, prev_ch, prev_genre, g_streak, node, used = state
                 
                 if time >= closing:
                     if score > best_solution[0]:
-                        best_solution = (score, list(sched_tuple))
+                        best_solution = (score, node)
+                    continue
+
+                # Bound: even the optimistic completion cannot beat the incumbent
+                if score + ub(time, prev_ch) <= best_solution[0]:
                     continue
                 
+                self.states_expanded += 1
                 candidates = self._get_candidates(time, prev_ch, prev_genre, g_streak, used)
                 
                 if not candidates:
@@ -359,23 +609,24 @@ class BeamSearchScheduler:
                     idx = bisect.bisect_right(self.times, time)
                     if idx < len(self.times) and self.times[idx] < closing:
                         next_time = self.times[idx]
-                        next_beam.append((score, next_time, prev_ch, prev_genre, g_streak, sched_tuple, used))
+                        next_beam.append((score, next_time, prev_ch, prev_genre, g_streak, node, used))
                     else:
                         # Terminal
                         if score > best_solution[0]:
-                            best_solution = (score, list(sched_tuple))
+                            best_solution = (score, node)
                     continue
                 
-                # Sort by score density heuristic: score + potential of remaining time
-                # This prefers candidates that give high score for less time usage
-                candidates.sort(key=lambda x: x[0] + (closing - x[5]) * self.avg_score_per_min, reverse=True)
+                # Rank by segment score + bound on what can follow it
+                candidates.sort(key=lambda x: x[0] + ub(x[5], x[2]), reverse=True)
                 
-                # Take top candidates
-                take_n = max(3, self.beam_width // len(beam) if len(beam) > 0 else self.beam_width)
+                # Take top candidates (bound pruning leaves room for a few more per state)
+                take_n = max(5, self.beam_width // len(beam) if len(beam) > 0 else self.beam_width)
                 
                 for i, (seg_score, ch_idx, ch_id, prog, seg_start, seg_end) in enumerate(candidates[:take_n]):
-                    new_sched = sched_tuple + ((prog.unique_id, ch_id, seg_start, seg_end, seg_score),)
-                    new_used = used | {prog.unique_id}
+                    if score + seg_score + ub(seg_end, ch_id) <= best_solution[0]:
+                        break  # sorted by this bound, so the rest cannot beat the incumbent either
+                    new_node = (node, (prog.unique_id, ch_id, seg_start, seg_end, seg_score))
+                    new_used = used | prog_bit[prog.unique_id]
                     new_streak = 1 if prog.genre != prev_genre else g_streak + 1
                     
                     next_beam.append((
@@ -384,15 +635,15 @@ class BeamSearchScheduler:
                         ch_id,
                         prog.genre,
                         new_streak,
-                        new_sched,
+                        new_node,
                         new_used
                     ))
             if not next_beam:
                 break
             
             # Keep best states
-            # Sort by heuristic: accumulated_score + potential_future_score
-            next_beam.sort(key=lambda x: x[0] + (closing - x[1]) * self.avg_score_per_min, reverse=True)
+            # Sort by heuristic: accumulated_score + upper bound of the remaining time
+            next_beam.sort(key=lambda x: x[0] + ub(x[1], x[2]), reverse=True)
             
             # Deduplicate by (time, prev_ch, genre_streak)
             seen = set()
@@ -407,7 +658,210 @@ class BeamSearchScheduler:
             
             beam = unique_beam
         
-        # Convert to Solution
+        return self._to_solution((best_solution[0], self._materialize(best_solution[1])))
+
+    def _frontier_search_core(self) -> Solution:
+        """Frontier search over the whole day (see _frontier_search)."""
+        self.states_expanded = 0
+        return self._to_solution(self._frontier_search())
+
+    def _frontier_search(self, start: Optional[tuple] = None,
+                         horizon_end: Optional[int] = None,
+                         exits: Optional[Dict[tuple, Tuple[int, list]]] = None,
+                         within_horizon: bool = False) -> Tuple[int, list]:
+        """
+        Time-ordered frontier search.
+
+        States are kept in buckets keyed by their decision time and the
+        buckets are expanded in chronological order (min-heap of times).
+        Every state therefore only competes with states at the same time
+        point, where score + upper bound compares like with like, and a
+        schedule reaching closing time updates the incumbent as soon as it
+        is generated.  Each bucket keeps its best ``bucket_width`` states,
+        one per (channel, genre, streak), and each state branches into at
+        most that many candidates.
+
+        ``start`` / ``horizon_end`` restrict the search to a window as in
+        _greedy_incumbent; a schedule is complete once it reaches
+        ``horizon_end``, and with ``within_horizon`` no segment runs past it.
+        Returns (score, segments) for the window only.
+        When ``exits`` is given, it additionally collects the best complete
+        schedule found per exit state (prev_ch_id, prev_genre, genre_streak).
+        """
+        closing = horizon_end if horizon_end is not None else self.instance_data.closing_time
+        if start is None:
+            start = (self.instance_data.opening_time, None, "", 0, 0)
+        start_time, start_ch, start_genre, start_streak, start_used = start
+        ub = self._upper_bound
+        prog_bit = self.prog_bit
+        width = self.bucket_width or max(5, self.beam_width // 10)
+
+        # Schedules are kept as nodes (see _materialize) until the search ends
+        best_score, best_sched = self._greedy_incumbent(start, closing, within_horizon)
+        best_solution = (best_score, self._link(best_sched))
+        found: Dict[tuple, Tuple[int, Optional[tuple]]] = {}
+
+        def finish(score: int, key: tuple, node: Optional[tuple]) -> None:
+            nonlocal best_solution
+            if score > best_solution[0]:
+                best_solution = (score, node)
+            if exits is not None and (key not in found or score > found[key][0]):
+                found[key] = (score, node)
+
+        if exits is not None:
+            finish(best_solution[0], self._exit_key(start, best_sched), best_solution[1])
+
+        # time -> list of (score, prev_ch_id, prev_genre, genre_streak, schedule_node, used_mask)
+        buckets: Dict[int, list] = {
+            start_time: [(0, start_ch, start_genre, start_streak, None, start_used)]
+        }
+        frontier = [start_time]
+
+        def push(state_time: int, state: tuple) -> None:
+            bucket = buckets.get(state_time)
+            if bucket is None:
+                buckets[state_time] = [state]
+                heapq.heappush(frontier, state_time)
+            else:
+                bucket.append(state)
+
+        while frontier:
+            time = heapq.heappop(frontier)
+            bucket = buckets.pop(time)
+
+            # All states share `time`, so score + bound ranks them fairly
+            bucket.sort(key=lambda x: x[0] + ub(time, x[1]), reverse=True)
+            seen = set()
+            kept = []
+            for state in bucket:
+                key = (state[1], state[2], state[3])  # prev_ch, genre, g_streak
+                if key in seen:
+                    continue
+                seen.add(key)
+                kept.append(state)
+                if len(kept) >= width:
+                    break
+
+            for score, prev_ch, prev_genre, g_streak, node, used in kept:
+                if score + ub(time, prev_ch) <= best_solution[0]:
+                    break  # sorted by this bound, so the rest of the bucket is dominated too
+
+                self.states_expanded += 1
+                if exits is not None:
+                    # Watching nothing more until the window end is a valid exit too
+                    finish(score, (prev_ch, prev_genre, g_streak), node)
+                candidates = self._get_candidates(time, prev_ch, prev_genre, g_streak, used, closing,
+                                                  within_horizon)
+
+                if not candidates:
+                    idx = bisect.bisect_right(self.times, time)
+                    if idx < len(self.times) and self.times[idx] < closing:
+                        push(self.times[idx], (score, prev_ch, prev_genre, g_streak, node, used))
+                    else:
+                        finish(score, (prev_ch, prev_genre, g_streak), node)
+                    continue
+
+                candidates.sort(key=lambda x: x[0] + ub(x[5], x[2]), reverse=True)
+                for seg_score, ch_idx, ch_id, prog, seg_start, seg_end in candidates[:width]:
+                    new_score = score + seg_score
+                    if new_score + ub(seg_end, ch_id) <= best_solution[0]:
+                        break
+                    new_node = (node, (prog.unique_id, ch_id, seg_start, seg_end, seg_score))
+                    new_streak = 1 if prog.genre != prev_genre else g_streak + 1
+                    if seg_end >= closing:
+                        finish(new_score, (ch_id, prog.genre, new_streak), new_node)
+                        continue
+                    push(seg_end, (new_score, ch_id, prog.genre, new_streak, new_node,
+                                   used | prog_bit[prog.unique_id]))
+
+        if exits is not None:
+            for key, (score, node) in found.items():
+                exits[key] = (score, self._materialize(node))
+        return best_solution[0], self._materialize(best_solution[1])
+
+    def _exit_key(self, start: tuple, sched: list) -> tuple:
+        """(prev_ch_id, prev_genre, genre_streak) after playing ``sched`` from ``start``."""
+        _, prev_ch, prev_genre, g_streak, _ = start
+        for prog_id, ch_id, _, _, _ in sched:
+            genre = self.prog_by_id[prog_id][0].genre
+            g_streak = 1 if genre != prev_genre else g_streak + 1
+            prev_ch, prev_genre = ch_id, genre
+        return prev_ch, prev_genre, g_streak
+
+    def solve_segment(self, start: tuple, horizon_end: int) -> Dict[tuple, Tuple[int, list]]:
+        """
+        Frontier-search the part of the day from ``start`` (time, prev_ch_id,
+        prev_genre, genre_streak, used_mask) up to the cut point ``horizon_end``.
+
+        Returns the best (score, segments) found per exit state
+        (prev_ch_id, prev_genre, genre_streak), for the decomposition planner
+        to stitch parts of the day together.
+        """
+        exits: Dict[tuple, Tuple[int, list]] = {}
+        self.states_expanded = 0
+        self._frontier_search(start, horizon_end, exits)
+        return exits
+
+    def _rolling_horizon_search(self) -> Solution:
+        """
+        Rolling-horizon frontier search for long (multi-day) horizons.
+
+        Each window of ``horizon_window`` minutes is solved from the boundary
+        state (time, channel, genre, streak, used programs) left by the
+        previous one; the segments starting within its first
+        ``horizon_commit`` minutes are committed and the next window starts
+        where they end.  Used programs that already ended are dropped from
+        the carried state, so per-window work and memory stay flat and the
+        total grows linearly with the horizon.
+        """
+        closing = self.instance_data.closing_time
+        state = (self.instance_data.opening_time, None, "", 0, 0)
+        live: Set[str] = set()
+        committed: list = []
+        total = 0
+        self.states_expanded = 0
+        self.windows_solved = 0
+
+        while state[0] < closing:
+            time, prev_ch, prev_genre, g_streak, used = state
+            window_end = min(closing, time + self.horizon_window)
+            score, segments = self._frontier_search(state, window_end)
+            self.windows_solved += 1
+
+            if window_end >= closing:
+                committed.extend(segments)
+                total += score
+                break
+
+            cutoff = time + self.horizon_commit
+            taken = [seg for seg in segments if seg[2] < cutoff]
+            if not taken:
+                # Nothing worth starting before the cutoff: move on to the next decision point
+                idx = bisect.bisect_left(self.times, cutoff)
+                if idx >= len(self.times):
+                    break
+                state = (self.times[idx], prev_ch, prev_genre, g_streak, used)
+                continue
+
+            for prog_id, ch_id, seg_start, seg_end, seg_score in taken:
+                prog = self.prog_by_id[prog_id][0]
+                g_streak = 1 if prog.genre != prev_genre else g_streak + 1
+                prev_ch, prev_genre = ch_id, prog.genre
+                live.add(prog_id)
+                total += seg_score
+            committed.extend(taken)
+
+            time = taken[-1][3]
+            live = {u for u in live if self.prog_by_id[u][0].end > time}
+            live_used = 0
+            for u in live:
+                live_used |= self.prog_bit[u]
+            state = (time, prev_ch, prev_genre, g_streak, live_used)
+
+        return self._to_solution((total, committed))
+
+    def _to_solution(self, best_solution: Tuple[int, list]) -> Solution:
+        """Convert a (score, [(prog_id, ch_id, start, end, seg_score)]) pair to a Solution."""
         scheduled = []
         for item in best_solution[1]:
             prog_id, ch_id, start, end, seg_score = item
@@ -459,7 +913,9 @@ class BeamSearchScheduler:
                 # Greedy fill from here
                 new_sched = prefix[:]
                 new_score = sum(s.fitness for s in prefix)
-                used = {s.unique_program_id for s in prefix}
+                used = 0
+                for s in prefix:
+                    used |= self.prog_bit.get(s.unique_program_id, 0)
                 
                 while time < self.instance_data.closing_time:
                     candidates = self._get_candidates(time, prev_ch, prev_genre, g_streak, used)
@@ -472,9 +928,10 @@ class BeamSearchScheduler:
                             break
                         continue
                     
-                    # Optimized: Use score density heuristic
-                    candidates.sort(key=lambda x: x[0] + (self.instance_data.closing_time - x[5]) * self.avg_score_per_min, reverse=True)
-                    seg_score, ch_idx, ch_id, prog, seg_start, seg_end = candidates[0]
+                    # Best segment score + bound on what can follow it
+                    seg_score, ch_idx, ch_id, prog, seg_start, seg_end = max(
+                        candidates, key=lambda x: x[0] + self._upper_bound(x[5], x[2])
+                    )
                     
                     new_sched.append(Schedule(
                         program_id=prog.program_id,
@@ -485,7 +942,7 @@ class BeamSearchScheduler:
                         unique_program_id=prog.unique_id
                     ))
                     new_score += seg_score
-                    used.add(prog.unique_id)
+                    used |= self.prog_bit[prog.unique_id]
                     
                     if prog.genre == prev_genre:
                         g_streak += 1
@@ -507,6 +964,18 @@ class BeamSearchScheduler:
         
         return Solution(best, best_score)
     
+    def _improve_locally(self, sol: Solution) -> Solution:
+        """Neighborhood local search, or the greedy refill when it has no time budget."""
+        if self.local_search_time > 0:
+            local = NeighborhoodSearch(self, time_budget=self.local_search_time)
+            sol = local.improve(sol)
+            if self.verbose:
+                print(f"  Local search: {local.moves_applied} moves applied")
+            return sol
+        # Greedy refill, with fewer iterations for large instances
+        iter_limit = 50 if self.n_channels <= 50 else 20
+        return self._local_search(sol, max_iter=iter_limit)
+
     def generate_solution(self) -> Solution:
         """Generate the maximum score solution."""
         # Adaptive parameters for large instances
@@ -525,11 +994,40 @@ class BeamSearchScheduler:
         # Strategy: Beam search (deterministic)
         if self.verbose:
             print("Running Beam Search...")
-        sol = self._beam_search_core()
+        sol = None
+        if self.workers > 1:
+            sol = DecompositionPlanner(self, workers=self.workers).solve()
+            if self.verbose:
+                print("  Decomposition: " + ("no cut points, solving whole day" if sol is None else "stitched parts"))
+        if sol is not None:
+            pass
+        elif self.search_mode == "frontier":
+            sol = self._frontier_search_core()
+        elif self.search_mode == "rolling":
+            sol = self._rolling_horizon_search()
+        elif self.search_mode == "beam":
+            sol = self._beam_search_core()
+        else:
+            sol = self._beam_search_core()
+            beam_expanded = self.states_expanded
+            alt = self._frontier_search_core()
+            if self.verbose:
+                print(f"  Beam: score={sol.total_score}, states expanded={beam_expanded}")
+                print(f"  Frontier: score={alt.total_score}, states expanded={self.states_expanded}")
+            self.states_expanded += beam_expanded
+            if alt.total_score > sol.total_score:
+                sol = alt
+        if self.verbose:
+            print(f"  Search ({self.search_mode}): score={sol.total_score}, states expanded={self.states_expanded}")
         
-        # Always run local search, but with fewer iterations for large instances
-        iter_limit = 50 if self.n_channels <= 50 else 20
-        sol = self._local_search(sol, max_iter=iter_limit)
+        sol = self._improve_locally(sol)
+        if self.lns_time > 0:
+            # Anneal from the local optimum, then polish the best schedule found
+            lns = LargeNeighborhoodSearch(self, time_budget=self.lns_time, window=self.lns_window)
+            sol = lns.improve(sol)
+            if self.verbose:
+                print(f"  LNS: score={sol.total_score}, {lns.accepted}/{lns.steps} repairs accepted")
+            sol = self._improve_locally(sol)
         
         if self.verbose:
             print(f"  Score: {sol.total_score}")
@@ -0,0 +1,215 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from models.solution import Solution
+
+# Per-process scheduler built once by the pool initializer
+_worker_scheduler = None
+
+
+def _init_worker(scheduler_cls, instance_data, scheduler_kwargs):
+    global _worker_scheduler
+    _worker_scheduler = scheduler_cls(instance_data, verbose=False, **scheduler_kwargs)
+
+
+def _solve_in_worker(start: tuple, horizon_end: int):
+    exits = _worker_scheduler.solve_segment(start, horizon_end)
+    return exits, _worker_scheduler.states_expanded
+
+
+class DecompositionPlanner:
+    """
+    Splits the day at forced cut points and solves the parts independently.
+
+    A time T is a cut when no segment can be watched across it: on every
+    channel T is a program boundary, or the program running over T is
+    forbidden by priority blocks on the whole of one side (e.g. a block
+    that allows a single channel turns every boundary of that channel into
+    a cut).  Parts then interact only through the boundary state
+    (channel, genre, streak): used programs never span a cut.
+
+    Parts are solved in parallel worker processes, collecting the best
+    schedule per exit state, and a small DP over the cuts stitches them
+    together.  Rather than every possible boundary state (channels x genres
+    x streaks), each part is solved from the free entry state and from the
+    few boundary states the DP actually favours; other entry states reuse
+    the free-entry schedules, re-scored for the switch penalty and checked
+    against the genre-streak limit.
+    """
+
+    def __init__(self, scheduler, workers: Optional[int] = None, min_part: int = 120,
+                 entry_candidates: int = 3):
+        self.scheduler = scheduler
+        self.workers = workers or os.cpu_count() or 1
+        self.min_part = min_part
+        self.entry_candidates = entry_candidates
+        self.states_expanded = 0
+
+    # ── cut points ──────────────────────────────────────────────────────
+
+    def _is_cut(self, time: int) -> bool:
+        s = self.scheduler
+        for ch_idx in range(s.n_channels):
+            prog = s._get_prog(ch_idx, time)
+            if prog is None or prog.start == time:
+                continue
+            if not s.has_priority_blocks:
+                return False
+            prefix = s.forbidden_prefix[ch_idx]
+            max_t = len(prefix) - 1
+            left = min(time, max_t) - min(prog.start, max_t)
+            right = min(prog.end, max_t) - min(time, max_t)
+            left_blocked = prefix[min(time, max_t)] - prefix[min(prog.start, max_t)] == left
+            right_blocked = prefix[min(prog.end, max_t)] - prefix[min(time, max_t)] == right
+            if not (left_blocked or right_blocked):
+                return False
+        return True
+
+    def find_cut_points(self) -> List[int]:
+        """Cut times at least ``min_part`` minutes apart (and from opening/closing)."""
+        opening = self.scheduler.instance_data.opening_time
+        closing = self.scheduler.instance_data.closing_time
+        cuts = []
+        last = opening
+        for t in self.scheduler.times:
+            if t - last < self.min_part or closing - t < self.min_part:
+                continue
+            if self._is_cut(t):
+                cuts.append(t)
+                last = t
+        return cuts
+
+    # ── boundary states ─────────────────────────────────────────────────
+
+    def _adapt(self, exits: Dict[tuple, Tuple[int, list]], key: tuple) -> Dict[tuple, Tuple[int, list]]:
+        """
+        Re-score schedules found from the free entry state for entry ``key``:
+        the first segment pays the switch penalty if it changes channel, and
+        schedules that would break the genre-streak limit are dropped.
+        """
+        s = self.scheduler
+        prev_ch, prev_genre, g_streak = key
+        max_streak = s.instance_data.max_consecutive_genre
+        switch_pen = s.instance_data.switch_penalty
+        adapted: Dict[tuple, Tuple[int, list]] = {}
+        for score, segments in exits.values():
+            if segments and prev_ch is not None and segments[0][1] != prev_ch:
+                prog_id, ch_id, start, end, seg_score = segments[0]
+                segments = [(prog_id, ch_id, start, end, seg_score - switch_pen)] + segments[1:]
+                score -= switch_pen
+            ch, genre, streak = prev_ch, prev_genre, g_streak
+            for prog_id, ch_id, _, _, _ in segments:
+                prog_genre = s.prog_by_id[prog_id][0].genre
+                streak = 1 if prog_genre != genre else streak + 1
+                if streak > max_streak:
+                    break
+                ch, genre = ch_id, prog_genre
+            else:
+                exit_key = (ch, genre, streak)
+                if exit_key not in adapted or score > adapted[exit_key][0]:
+                    adapted[exit_key] = (score, segments)
+        return adapted
+
+    def _stitch(self, bounds: List[int], results, free) -> Tuple[int, list, List[Dict[tuple, int]]]:
+        """
+        DP over the cuts.  Part results come from ``results`` (exact, keyed
+        by (part, entry key)) when available, else from the part's free-entry
+        solve adapted to the entry key (solved on the spot when none of those
+        fits).  Returns the best total, its schedule
+        and the DP value of every boundary state at every cut.
+        """
+        initial = (None, "", 0)
+        layer: Dict[tuple, Tuple[int, Optional[tuple], list]] = {initial: (0, None, [])}
+        history = []
+        for part in range(len(bounds) - 1):
+            nxt: Dict[tuple, Tuple[int, Optional[tuple], list]] = {}
+            for key, (score, _, _) in layer.items():
+                exits = results.get((part, key))
+                if exits is None:
+                    exits = self._adapt(free[part], key)
+                if not exits:
+                    # No free-entry schedule fits this entry state: solve it here
+                    exits = self._run([(part, key)], bounds)[(part, key)]
+                    results[(part, key)] = exits
+                for exit_key, (part_score, segments) in exits.items():
+                    total = score + part_score
+                    if exit_key not in nxt or total > nxt[exit_key][0]:
+                        nxt[exit_key] = (total, key, segments)
+            history.append(nxt)
+            layer = nxt
+
+        # Walk the back-pointers from the best final state
+        key = max(layer, key=lambda k: layer[k][0])
+        total = layer[key][0]
+        parts = []
+        for nxt in reversed(history):
+            _, key, segments = nxt[key]
+            parts.append(segments)
+        schedule = [seg for segments in reversed(parts) for seg in segments]
+        values = [{k: v[0] for k, v in nxt.items()} for nxt in history]
+        return total, schedule, values
+
+    # ── solve ───────────────────────────────────────────────────────────
+
+    def _run(self, tasks: List[Tuple[int, tuple]], bounds: List[int]) -> Dict[Tuple[int, tuple], dict]:
+        """Solve (part, entry key) tasks, in worker processes when allowed."""
+        s = self.scheduler
+        results = {}
+
+        def start_of(part: int, key: tuple) -> tuple:
+            return (bounds[part],) + key + (0,)
+
+        if self.workers > 1 and len(tasks) > 1:
+            kwargs = {
+                "beam_width": s.beam_width,
+                "lookahead_limit": s.lookahead_limit,
+                "bucket_width": s.bucket_width,
+            }
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(tasks)),
+                initializer=_init_worker,
+                initargs=(type(s), s.instance_data, kwargs),
+            ) as pool:
+                futures = {
+                    task: pool.submit(_solve_in_worker, start_of(*task), bounds[task[0] + 1])
+                    for task in tasks
+                }
+                for task, future in futures.items():
+                    results[task], expanded = future.result()
+                    self.states_expanded += expanded
+        else:
+            for part, key in tasks:
+                results[(part, key)] = s.solve_segment(start_of(part, key), bounds[part + 1])
+                self.states_expanded += s.states_expanded
+        return results
+
+    def solve(self) -> Optional[Solution]:
+        """
+        Stitched solution, or None when the day has no cut point.
+
+        Round 1 solves every part from the free entry state (nothing watched
+        yet) in parallel.  Round 2 re-solves, again in parallel, each part
+        from the ``entry_candidates`` boundary states the round-1 DP values
+        most; the final DP uses exact results where it has them.
+        """
+        s = self.scheduler
+        cuts = self.find_cut_points()
+        if not cuts:
+            return None
+
+        bounds = [s.instance_data.opening_time] + cuts + [s.instance_data.closing_time]
+        free_key = (None, "", 0)
+        results = self._run([(part, free_key) for part in range(len(bounds) - 1)], bounds)
+        free = [results[(part, free_key)] for part in range(len(bounds) - 1)]
+
+        _, _, values = self._stitch(bounds, results, free)
+        tasks = []
+        for part in range(1, len(bounds) - 1):
+            ranked = sorted(values[part - 1].items(), key=lambda kv: kv[1], reverse=True)
+            tasks.extend((part, key) for key, _ in ranked[:self.entry_candidates] if key != free_key)
+        results.update(self._run(tasks, bounds))
+
+        total, schedule, _ = self._stitch(bounds, results, free)
+        s.states_expanded = self.states_expanded
+        return s._to_solution((total, schedule))
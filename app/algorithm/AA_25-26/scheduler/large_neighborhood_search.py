@@ -0,0 +1,162 @@
+import bisect
+import math
+import random
+import time
+from typing import List, Optional, Tuple
+
+from models.solution import Solution
+
+# (unique_program_id, channel_id, start, end, seg_score), as in BeamSearchScheduler
+Segment = Tuple[str, int, int, int, int]
+
+
+class LargeNeighborhoodSearch:
+    """
+    Destroy-and-repair improvement of a complete schedule.
+
+    Each step removes the segments inside a random time window of
+    ``window / 2`` to ``window`` minutes and re-solves the gap with the
+    scheduler's frontier search, started from the state the kept prefix
+    leaves and not allowed to run past the start of the kept suffix.  Every
+    exit state of that search is tried against the suffix (its first
+    segment re-scored for the switch penalty, the genre streak checked
+    across the join) and the best complete schedule is the step's result.
+
+    Results are accepted by simulated annealing: a loss of d points passes
+    with probability exp(-d / T), T cooling linearly from ``temperature``
+    to 0 over the ``time_budget`` seconds.  The search stops early after
+    ``patience`` steps in a row without a new best schedule (failed repairs
+    included).  The best schedule seen is returned.
+    """
+
+    def __init__(self, scheduler, time_budget: float = 1.0, window: int = 240,
+                 temperature: Optional[float] = None, seed: int = 0, patience: int = 100):
+        self.scheduler = scheduler
+        self.time_budget = time_budget
+        self.window = max(window, scheduler.min_d)
+        instance = scheduler.instance_data
+        if temperature is None:
+            temperature = max(1, instance.switch_penalty, instance.termination_penalty)
+        self.temperature = temperature
+        self.rng = random.Random(seed)
+        self.patience = patience
+        self.steps = 0
+        self.accepted = 0
+
+    def _entry_state(self, prefix: List[Segment], suffix: List[Segment]) -> tuple:
+        """Frontier-search start state after ``prefix``, with the suffix's programs marked used."""
+        s = self.scheduler
+        used = 0
+        for seg in prefix:
+            used |= s.prog_bit[seg[0]]
+        for seg in suffix:
+            used |= s.prog_bit[seg[0]]
+        if not prefix:
+            return s.instance_data.opening_time, None, "", 0, used
+        genre = s.prog_by_id[prefix[-1][0]][0].genre
+        streak = 0
+        for seg in reversed(prefix):
+            if s.prog_by_id[seg[0]][0].genre != genre:
+                break
+            streak += 1
+        return prefix[-1][3], prefix[-1][1], genre, streak, used
+
+    def _join(self, key: tuple, suffix: List[Segment]) -> Optional[Tuple[int, List[Segment]]]:
+        """
+        Score and segments of ``suffix`` played after exit state ``key``
+        (prev_ch_id, prev_genre, genre_streak), or None if that breaks the
+        genre-streak limit.
+        """
+        if not suffix:
+            return 0, suffix
+        s = self.scheduler
+        prev_ch, prev_genre, streak = key
+        max_streak = s.instance_data.max_consecutive_genre
+        for seg in suffix:
+            genre = s.prog_by_id[seg[0]][0].genre
+            if genre != prev_genre:
+                break
+            streak += 1
+            if streak > max_streak:
+                return None
+
+        prog_id, ch_id, start, end, _ = suffix[0]
+        prog, ch_idx = s.prog_by_id[prog_id]
+        first = (prog_id, ch_id, start, end, s._calc_score(prog, ch_idx, start, end, prev_ch))
+        joined = [first] + suffix[1:]
+        return sum(seg[4] for seg in joined), joined
+
+    def _repair(self, sched: List[Segment], win_start: int, win_end: int) -> Optional[Tuple[int, List[Segment]]]:
+        """Best schedule keeping the segments outside [win_start, win_end)."""
+        s = self.scheduler
+        ends = [seg[3] for seg in sched]
+        starts = [seg[2] for seg in sched]
+        prefix = sched[:bisect.bisect_right(ends, win_start)]
+        suffix = sched[max(len(prefix), bisect.bisect_left(starts, win_end)):]
+        start = self._entry_state(prefix, suffix)
+        horizon_end = suffix[0][2] if suffix else s.instance_data.closing_time
+        if horizon_end - start[0] < s.min_d:
+            return None
+
+        exits = {}
+        s._frontier_search(start, horizon_end, exits, within_horizon=True)
+        prefix_score = sum(seg[4] for seg in prefix)
+        best = None
+        for key, (score, segments) in exits.items():
+            joined = self._join(key, suffix)
+            if joined is None:
+                continue
+            total = prefix_score + score + joined[0]
+            if best is None or total > best[0]:
+                best = (total, prefix + segments + joined[1])
+        return best
+
+    def improve(self, solution: Solution) -> Solution:
+        """Best schedule found within the time budget (``solution`` if none beats it)."""
+        s = self.scheduler
+        if self.time_budget <= 0:
+            return solution
+        opening = s.instance_data.opening_time
+        closing = s.instance_data.closing_time
+        started = time.perf_counter()
+        # Search counters belong to the main search; keep them
+        states_expanded = s.states_expanded
+
+        current = sorted(
+            ((x.unique_program_id, x.channel_id, x.start, x.end, x.fitness) for x in solution.scheduled_programs),
+            key=lambda seg: seg[2],
+        )
+        current_score = solution.total_score
+        best_score, best = current_score, None
+        window_starts = [t for t in s.times if opening <= t <= closing - s.min_d]
+        if not window_starts:
+            s.states_expanded = states_expanded
+            return solution
+
+        idle = 0
+        while idle < self.patience:
+            elapsed = time.perf_counter() - started
+            if elapsed >= self.time_budget:
+                break
+            self.steps += 1
+            idle += 1
+            win_start = self.rng.choice(window_starts)
+            win_end = min(closing, win_start + self.rng.randint(self.window // 2, self.window))
+            result = self._repair(current, win_start, win_end)
+            if result is None:
+                continue
+
+            score, sched = result
+            temperature = self.temperature * (1 - elapsed / self.time_budget)
+            delta = score - current_score
+            if delta >= 0 or (temperature > 0 and self.rng.random() < math.exp(delta / temperature)):
+                current, current_score = sched, score
+                self.accepted += 1
+                if score > best_score:
+                    best_score, best = score, sched
+                    idle = 0
+
+        s.states_expanded = states_expanded
+        if best is None:
+            return solution
+        return s._to_solution((best_score, best))
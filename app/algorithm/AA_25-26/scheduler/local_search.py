@@ -0,0 +1,259 @@
+import bisect
+import time
+from typing import Iterator, List, Optional, Tuple
+
+from models.program import Program
+from models.schedule import Schedule
+from models.solution import Solution
+
+# (program, channel index, channel id, start, end, score including the switch penalty)
+Segment = Tuple[Program, int, int, int, int, int]
+# A move replaces segments [i, j) with these (program, channel index, start, end)
+Move = Tuple[int, List[Tuple[Program, int, int, int]]]
+
+
+class NeighborhoodSearch:
+    """
+    Hill climbing over a complete schedule with four move types:
+
+      * swap:    the same interval watched on another channel
+      * shift:   move a segment's start or end to another decision point,
+                 together with the neighbour sharing that boundary
+      * replace: any other segment fitting between the two neighbours
+      * merge:   two consecutive segments replaced by one program airing
+                 over both
+
+    A move replaces at most two consecutive segments, so it is scored in
+    O(1) by delta: the new segments' own terms (program score, preference
+    bonus, termination and switch penalties), the follower's switch term,
+    and the genre streak across both joins, read from running same-genre
+    run lengths kept per position.  Applying a move recomputes those run
+    lengths, O(n), which is rare next to evaluating moves.
+
+    The best improving move at each position is applied right away.  The
+    search stops when a full pass finds none or after ``max_passes``
+    passes, so its result does not depend on machine speed;
+    ``time_budget`` seconds only back that up.
+
+    Uses the indices of the BeamSearchScheduler it is given.
+    """
+
+    def __init__(self, scheduler, time_budget: float = 10.0, max_passes: int = 10):
+        self.scheduler = scheduler
+        self.time_budget = time_budget
+        self.max_passes = max_passes
+        self.moves_applied = 0
+        self.passes = 0
+        self._sched: List[Segment] = []
+        self._used = set()
+        # Same-genre run length ending at / starting at each position
+        self._run_before: List[int] = []
+        self._run_after: List[int] = []
+
+    def _index_runs(self) -> None:
+        sched = self._sched
+        n = len(sched)
+        before, after = [1] * n, [1] * n
+        for i in range(1, n):
+            if sched[i][0].genre == sched[i - 1][0].genre:
+                before[i] = before[i - 1] + 1
+        for i in range(n - 2, -1, -1):
+            if sched[i][0].genre == sched[i + 1][0].genre:
+                after[i] = after[i + 1] + 1
+        self._run_before, self._run_after = before, after
+
+    # ── delta scoring ───────────────────────────────────────────────────
+
+    def _delta(self, i: int, j: int, new: List[Tuple[Program, int, int, int]]) -> Optional[Tuple[int, int, list]]:
+        """
+        Score change of replacing segments [i, j) with ``new``, or None when
+        that breaks a constraint.  Returns (delta, k, segments): the scored
+        segments replace [i, k), k = j + 1 when the follower is re-scored.
+        """
+        s = self.scheduler
+        sched = self._sched
+        # j - i and len(new) are at most 2, so these checks are O(1)
+        for n, (prog, _, _, _) in enumerate(new):
+            uid = prog.unique_id
+            if any(other.unique_id == uid for other, _, _, _ in new[:n]):
+                return None
+            if uid in self._used and not any(seg[0].unique_id == uid for seg in sched[i:j]):
+                return None
+
+        max_streak = s.instance_data.max_consecutive_genre
+        if i > 0:
+            prev_genre, streak = sched[i - 1][0].genre, self._run_before[i - 1]
+        else:
+            prev_genre, streak = None, 0
+        for prog, _, _, _ in new:
+            streak = streak + 1 if prog.genre == prev_genre else 1
+            if streak > max_streak:
+                return None
+            prev_genre = prog.genre
+        if j < len(sched) and sched[j][0].genre == prev_genre and streak + self._run_after[j] > max_streak:
+            return None
+
+        delta = -sum(seg[5] for seg in sched[i:j])
+        prev_ch = sched[i - 1][2] if i > 0 else None
+        segments = []
+        for prog, ch_idx, start, end in new:
+            ch_id = s.instance_data.channels[ch_idx].channel_id
+            score = s._calc_score(prog, ch_idx, start, end, prev_ch)
+            segments.append((prog, ch_idx, ch_id, start, end, score))
+            delta += score
+            prev_ch = ch_id
+
+        if j < len(sched):
+            prog, ch_idx, ch_id, start, end, score = sched[j]
+            old_prev = sched[j - 1][2] if j > 0 else None
+            switch = s.instance_data.switch_penalty
+            new_score = (score + (switch if old_prev is not None and old_prev != ch_id else 0)
+                         - (switch if prev_ch is not None and prev_ch != ch_id else 0))
+            if new_score != score:
+                segments.append((prog, ch_idx, ch_id, start, end, new_score))
+                return delta + new_score - score, j + 1, segments
+        return delta, j, segments
+
+    def _fits(self, prog: Program, ch_idx: int, start: int, end: int) -> bool:
+        s = self.scheduler
+        return (end - start >= s.min_d and prog.start <= start and end <= prog.end
+                and s.instance_data.opening_time <= start and end <= s.instance_data.closing_time
+                and s._channel_allowed(ch_idx, start, end))
+
+    def _times_between(self, lo: int, hi: int) -> List[int]:
+        """Decision points in [lo, hi], always including both ends."""
+        times = self.scheduler.times
+        inner = times[bisect.bisect_right(times, lo):bisect.bisect_left(times, hi)]
+        return [lo] + inner + [hi] if hi > lo else [lo]
+
+    # ── moves ───────────────────────────────────────────────────────────
+
+    def _swap_moves(self, i: int) -> Iterator[Move]:
+        s = self.scheduler
+        prog, ch_idx, _, start, end, _ = self._sched[i]
+        for other in range(s.n_channels):
+            if other == ch_idx:
+                continue
+            alt = s._get_prog(other, start)
+            if alt is not None and self._fits(alt, other, start, end):
+                yield i + 1, [(alt, other, start, end)]
+
+    def _shift_moves(self, i: int) -> Iterator[Move]:
+        s = self.scheduler
+        sched = self._sched
+        prog, ch_idx, _, start, end, _ = sched[i]
+        nxt = sched[i + 1] if i + 1 < len(sched) else None
+        prv = sched[i - 1] if i > 0 else None
+
+        if nxt is not None and nxt[3] == end:
+            # Shared boundary: the next segment starts where this one now ends
+            n_prog, n_ch = nxt[0], nxt[1]
+            for t in self._times_between(max(start + s.min_d, n_prog.start), min(prog.end, nxt[4] - s.min_d)):
+                if t != end and self._fits(prog, ch_idx, start, t) and self._fits(n_prog, n_ch, t, nxt[4]):
+                    yield i + 2, [(prog, ch_idx, start, t), (n_prog, n_ch, t, nxt[4])]
+        else:
+            limit = nxt[3] if nxt is not None else s.instance_data.closing_time
+            for t in self._times_between(start + s.min_d, min(prog.end, limit)):
+                if t != end and self._fits(prog, ch_idx, start, t):
+                    yield i + 1, [(prog, ch_idx, start, t)]
+
+        if prv is None or prv[4] < start:
+            # Start facing a gap (a shared one is moved from the previous segment)
+            lo = max(prog.start, prv[4] if prv is not None else s.instance_data.opening_time)
+            for t in self._times_between(lo, end - s.min_d):
+                if t != start and self._fits(prog, ch_idx, t, end):
+                    yield i + 1, [(prog, ch_idx, t, end)]
+
+    def _replace_moves(self, i: int) -> Iterator[Move]:
+        s = self.scheduler
+        sched = self._sched
+        lo = sched[i - 1][4] if i > 0 else s.instance_data.opening_time
+        hi = sched[i + 1][3] if i + 1 < len(sched) else s.instance_data.closing_time
+        current = sched[i][0]
+        for ch_idx in range(s.n_channels):
+            progs = s.ch_progs[ch_idx]
+            idx = max(0, bisect.bisect_right(s.ch_starts[ch_idx], lo) - 1)
+            while idx < len(progs) and progs[idx].start <= hi - s.min_d:
+                prog = progs[idx]
+                idx += 1
+                start = max(prog.start, lo)
+                if prog is current or prog.end - start < s.min_d:
+                    continue
+                for end, _ in s._end_options(prog, ch_idx, start):
+                    if end > hi:
+                        break
+                    yield i + 1, [(prog, ch_idx, start, end)]
+                if hi < prog.end and self._fits(prog, ch_idx, start, hi):
+                    yield i + 1, [(prog, ch_idx, start, hi)]
+
+    def _merge_moves(self, i: int) -> Iterator[Move]:
+        s = self.scheduler
+        if i + 1 >= len(self._sched):
+            return
+        start, end = self._sched[i][3], self._sched[i + 1][4]
+        for ch_idx in range(s.n_channels):
+            prog = s._get_prog(ch_idx, start)
+            if prog is not None and self._fits(prog, ch_idx, start, end):
+                yield i + 2, [(prog, ch_idx, start, end)]
+
+    # ── search ──────────────────────────────────────────────────────────
+
+    def improve(self, solution: Solution) -> Solution:
+        """Best solution reachable by improving moves within the pass cap and time budget."""
+        s = self.scheduler
+        deadline = time.perf_counter() + self.time_budget
+
+        self._sched = []
+        prev_ch = None
+        for item in sorted(solution.scheduled_programs, key=lambda x: x.start):
+            prog, ch_idx = s.prog_by_id[item.unique_program_id]
+            score = s._calc_score(prog, ch_idx, item.start, item.end, prev_ch)
+            self._sched.append((prog, ch_idx, item.channel_id, item.start, item.end, score))
+            prev_ch = item.channel_id
+        self._used = {seg[0].unique_id for seg in self._sched}
+        start_total = sum(seg[5] for seg in self._sched)
+        self._index_runs()
+
+        moves = (self._swap_moves, self._shift_moves, self._replace_moves, self._merge_moves)
+        improved = True
+        while improved and self.passes < self.max_passes:
+            improved = False
+            self.passes += 1
+            for move in moves:
+                i = 0
+                while i < len(self._sched):
+                    if time.perf_counter() > deadline:
+                        return self._result(solution, start_total)
+                    best = None
+                    for j, new in move(i):
+                        result = self._delta(i, j, new)
+                        if result is not None and result[0] > 0 and (best is None or result[0] > best[0]):
+                            best = result
+                    if best is not None:
+                        _, k, segments = best
+                        for seg in self._sched[i:k]:
+                            self._used.discard(seg[0].unique_id)
+                        self._sched[i:k] = segments
+                        self._used.update(seg[0].unique_id for seg in segments)
+                        self._index_runs()
+                        self.moves_applied += 1
+                        improved = True
+                    i += 1
+        return self._result(solution, start_total)
+
+    def _result(self, solution: Solution, start_total: int) -> Solution:
+        total = sum(seg[5] for seg in self._sched)
+        if total <= start_total:
+            return solution
+        scheduled = [
+            Schedule(
+                program_id=prog.program_id,
+                channel_id=ch_id,
+                start=start,
+                end=end,
+                fitness=score,
+                unique_program_id=prog.unique_id
+            )
+            for prog, _, ch_id, start, end, score in self._sched
+        ]
+        return Solution(scheduled, total)
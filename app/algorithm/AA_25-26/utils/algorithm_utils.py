@@ -4,24 +4,25 @@ from models.channel import Channel
 from models.instance_data import InstanceData
 from models.program import Program
 from models.schedule import Schedule
-from utils.utils import Utils
+from utils.instance_index import InstanceIndex
 
 
 class AlgorithmUtils:
 
     @staticmethod
-    def get_best_fit(scheduled_programs: List[Schedule], instance_data: InstanceData, schedule_time: int,
+    def get_best_fit(scheduled_programs: List[Schedule], index: InstanceIndex, schedule_time: int,
                      valid_channel_indexes: List[int]) ->  tuple[Channel, Program, int]:
 
         # returns best channel to pick at the time and what score will it provide if we switch to it
 
+        instance_data = index.instance
         max_score = 0
         best_channel = None
         best_program = None
 
         for channel_index in valid_channel_indexes:
             channel = instance_data.channels[channel_index]
-            program = Utils.get_channel_program_by_time(channel, schedule_time)
+            program = index.program_at(channel_index, schedule_time)
 
             if not program:
                 continue
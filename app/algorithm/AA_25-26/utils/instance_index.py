@@ -0,0 +1,81 @@
+import bisect
+from types import MappingProxyType
+from typing import Optional
+
+from models.instance_data import InstanceData
+from models.program import Program
+
+
+class InstanceIndex:
+    """
+    Read-only lookups over one parsed instance.
+
+    Built once per instance and passed explicitly to the scheduler, the
+    validators and AlgorithmUtils, replacing the class-level caches Utils
+    used to keep for "the current instance".  Channels are addressed by
+    their position in ``instance.channels``.  Nothing is mutated after
+    construction, so one index can be shared by several threads, and two
+    instances can be solved side by side in one process.
+    """
+
+    __slots__ = (
+        "instance",
+        "channel_positions",
+        "programs_by_channel",
+        "program_starts",
+        "programs_by_unique_id",
+        "program_channel",
+    )
+
+    def __init__(self, instance_data: InstanceData):
+        positions = {}
+        programs_by_channel = []
+        program_starts = []
+        by_unique_id = {}
+        program_channel = {}
+
+        for ch_idx, channel in enumerate(instance_data.channels):
+            positions[channel.channel_id] = ch_idx
+            programs = tuple(sorted(channel.programs, key=lambda p: p.start))
+            programs_by_channel.append(programs)
+            program_starts.append(tuple(p.start for p in programs))
+            for program in programs:
+                by_unique_id[program.unique_id] = program
+                program_channel[program.unique_id] = ch_idx
+
+        assign = object.__setattr__
+        assign(self, "instance", instance_data)
+        # channel_id -> position in instance.channels
+        assign(self, "channel_positions", MappingProxyType(positions))
+        # per channel position: programs sorted by start, and their start times
+        assign(self, "programs_by_channel", tuple(programs_by_channel))
+        assign(self, "program_starts", tuple(program_starts))
+        # unique_program_id -> Program / channel position
+        assign(self, "programs_by_unique_id", MappingProxyType(by_unique_id))
+        assign(self, "program_channel", MappingProxyType(program_channel))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("InstanceIndex is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("InstanceIndex is read-only")
+
+    def __reduce__(self):
+        # Mapping proxies don't pickle; rebuild from the instance instead
+        return InstanceIndex, (self.instance,)
+
+    def program_at(self, channel_index: int, time: int) -> Optional[Program]:
+        """Program airing on the channel at ``time`` (binary search), if any."""
+        starts = self.program_starts[channel_index]
+        idx = bisect.bisect_right(starts, time) - 1
+        if idx >= 0:
+            program = self.programs_by_channel[channel_index][idx]
+            if program.start <= time < program.end:
+                return program
+        return None
+
+    def program_by_unique_id(self, unique_id: str) -> Optional[Program]:
+        return self.programs_by_unique_id.get(unique_id)
+
+    def channel_index(self, channel_id: int) -> Optional[int]:
+        return self.channel_positions.get(channel_id)
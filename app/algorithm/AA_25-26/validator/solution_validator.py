@@ -0,0 +1,122 @@
+import bisect
+from typing import Dict, List, Tuple
+
+from models.program import Program
+from models.solution import Solution
+from utils.instance_index import InstanceIndex
+from validator.exceptions.constraint_exception import ConstraintException
+
+
+class SolutionValidator:
+    """
+    Checks a complete Solution against every constraint in one pass and
+    recomputes its score.
+
+    Unlike Validator, which answers "may this channel be picked at this
+    time" for one step of a constructive algorithm, this validates a
+    finished schedule: programs are looked up in the InstanceIndex and the
+    priority blocks are merged once into per-channel forbidden intervals,
+    so checking n scheduled segments costs O(n log B).
+    """
+
+    def __init__(self, index: InstanceIndex):
+        self.index = index
+        self.instance_data = instance_data = index.instance
+
+        # channel_id -> sorted, merged [start, end) intervals the channel may not be watched in
+        self.forbidden: Dict[int, List[Tuple[int, int]]] = {}
+        for channel in instance_data.channels:
+            intervals = sorted(
+                (block.start, block.end)
+                for block in instance_data.priority_blocks
+                if channel.channel_id not in block.allowed_channels and block.start < block.end
+            )
+            merged: List[Tuple[int, int]] = []
+            for start, end in intervals:
+                if merged and start <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+                else:
+                    merged.append((start, end))
+            self.forbidden[channel.channel_id] = merged
+        self.forbidden_starts = {ch_id: [s for s, _ in iv] for ch_id, iv in self.forbidden.items()}
+
+        self.prefs_by_genre: Dict[str, list] = {}
+        for pref in instance_data.time_preferences:
+            self.prefs_by_genre.setdefault(pref.preferred_genre, []).append(pref)
+
+    def _is_forbidden(self, channel_id: int, start: int, end: int) -> bool:
+        intervals = self.forbidden.get(channel_id)
+        if not intervals:
+            return False
+        # Last interval starting before `end` is the only one that can overlap [start, end)
+        idx = bisect.bisect_left(self.forbidden_starts[channel_id], end) - 1
+        return idx >= 0 and intervals[idx][1] > start
+
+    def segment_score(self, program: Program, start: int, end: int, switched: bool) -> int:
+        """Score of watching ``program`` over [start, end), as the schedulers compute it."""
+        score = program.score
+        for pref in self.prefs_by_genre.get(program.genre, ()):
+            if min(end, pref.end) - max(start, pref.start) >= self.instance_data.min_duration:
+                score += pref.bonus
+                break
+        if switched:
+            score -= self.instance_data.switch_penalty
+        if start > program.start:
+            score -= self.instance_data.termination_penalty
+        if end < program.end:
+            score -= self.instance_data.termination_penalty
+        return score
+
+    def validate(self, solution: Solution, check_total: bool = True) -> int:
+        """
+        Raise ConstraintException on the first violated constraint; return
+        the recomputed total score.  With ``check_total`` the solution's
+        reported total must match it.
+        """
+        instance = self.instance_data
+        schedules = sorted(solution.scheduled_programs, key=lambda s: s.start)
+
+        used = set()
+        total = 0
+        prev_end = instance.opening_time
+        prev_channel = None
+        prev_genre = None
+        streak = 0
+
+        for schedule in schedules:
+            program = self.index.program_by_unique_id(schedule.unique_program_id)
+            if program is None:
+                raise ConstraintException(f"Unknown program '{schedule.unique_program_id}'.")
+            channel_id = instance.channels[self.index.program_channel[schedule.unique_program_id]].channel_id
+            label = f"'{schedule.unique_program_id}' [{schedule.start}, {schedule.end})"
+
+            if channel_id != schedule.channel_id:
+                raise ConstraintException(f"{label} is not broadcast on channel {schedule.channel_id}.")
+            if schedule.unique_program_id in used:
+                raise ConstraintException(f"{label} is scheduled more than once.")
+            if schedule.start < instance.opening_time or schedule.end > instance.closing_time:
+                raise ConstraintException(f"{label} is outside opening hours.")
+            if schedule.start < program.start or schedule.end > program.end:
+                raise ConstraintException(f"{label} is outside the program's airtime.")
+            if schedule.end - schedule.start < instance.min_duration:
+                raise ConstraintException(f"{label} is shorter than min_duration.")
+            if schedule.start < prev_end:
+                raise ConstraintException(f"{label} overlaps the previous selection.")
+            if self._is_forbidden(channel_id, schedule.start, schedule.end):
+                raise ConstraintException(f"{label}: channel not allowed in priority block.")
+
+            streak = streak + 1 if program.genre == prev_genre else 1
+            if streak > instance.max_consecutive_genre:
+                raise ConstraintException(f"{label}: max consecutive genre has been reached.")
+
+            switched = prev_channel is not None and prev_channel != channel_id
+            total += self.segment_score(program, schedule.start, schedule.end, switched)
+
+            used.add(schedule.unique_program_id)
+            prev_end, prev_channel, prev_genre = schedule.end, channel_id, program.genre
+
+        if check_total and total != solution.total_score:
+            raise ConstraintException(
+                f"Reported total score {solution.total_score} does not match recomputed {total}."
+            )
+        return total
@@ -2,20 +2,20 @@ from typing import List
 
 from models.instance_data import InstanceData
 from models.schedule import Schedule
-from utils.utils import Utils
+from utils.instance_index import InstanceIndex
 from validator.exceptions.constraint_exception import ConstraintException
 
 
 class Validator:
 
     @staticmethod
-    def is_channel_valid(schedule_plan: List[Schedule], instance_data: InstanceData, channel_index: int,
+    def is_channel_valid(schedule_plan: List[Schedule], index: InstanceIndex, channel_index: int,
                          schedule_time: int):
         try:
-            Validator.validate_schedule_time(instance_data, schedule_time)
-            Validator.validate_min_duration(schedule_plan, instance_data, schedule_time)
-            Validator.validate_max_consecutive_genre(schedule_plan, instance_data, channel_index, schedule_time)
-            Validator.validate_priority_time_block(instance_data, channel_index, schedule_time)
+            Validator.validate_schedule_time(index.instance, schedule_time)
+            Validator.validate_min_duration(schedule_plan, index.instance, schedule_time)
+            Validator.validate_max_consecutive_genre(schedule_plan, index, channel_index, schedule_time)
+            Validator.validate_priority_time_block(index, channel_index, schedule_time)
         except ConstraintException:
             return False
 
@@ -39,40 +39,38 @@ class Validator:
             raise ConstraintException("min_duration for broadcasting channel has not been reached.")
 
     @staticmethod
-    def validate_max_consecutive_genre(schedule_plan: List[Schedule], instance_data: InstanceData, channel_index: int,
+    def validate_max_consecutive_genre(schedule_plan: List[Schedule], index: InstanceIndex, channel_index: int,
                                        schedule_time: int):
         if not schedule_plan:
             return
 
-        channel_to_insert = instance_data.channels[channel_index]
-        program = Utils.get_channel_program_by_time(channel_to_insert, schedule_time)
+        program = index.program_at(channel_index, schedule_time)
 
         if not program:
             return
 
         count = 0
         for schedule in reversed(schedule_plan):
-            scheduled_program = Utils.get_program_by_unique_id(instance_data, schedule.unique_program_id)
+            scheduled_program = index.program_by_unique_id(schedule.unique_program_id)
             if scheduled_program.genre != program.genre:
                 break
             count += 1
 
         # Max R consecutive means we can have R programs, so reject if count + 1 > R
-        if count + 1 > instance_data.max_consecutive_genre:
+        if count + 1 > index.instance.max_consecutive_genre:
             raise ConstraintException("max consecutive genre has been reached.")
 
     @staticmethod
-    def validate_priority_time_block(instance_data: InstanceData, channel_index: int, schedule_time: int):
-        channel_to_insert = instance_data.channels[channel_index]
-        channel_to_insert_id = channel_to_insert.channel_id
+    def validate_priority_time_block(index: InstanceIndex, channel_index: int, schedule_time: int):
+        channel_to_insert_id = index.instance.channels[channel_index].channel_id
         
         # Get the actual program that would be scheduled
-        program = Utils.get_channel_program_by_time(channel_to_insert, schedule_time)
+        program = index.program_at(channel_index, schedule_time)
         if not program:
             return
         
         # Check if the program's duration overlaps with any priority block
-        for block in instance_data.priority_blocks:
+        for block in index.instance.priority_blocks:
             # Check if program's time range [program.start, program.end) overlaps with block [block.start, block.end)
             if (program.start < block.end and program.end > block.start and 
                     channel_to_insert_id not in block.allowed_channels):
@@ -12,18 +12,19 @@ Endpoints:
 """
 
 import uuid
-import json
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from app.models.request_response import ScheduleRequest, ScheduleResponse, ScheduleStatus
 from app.services.scheduler_service import SchedulerService
 from app.services.request_store import store, RequestStatus
 from app.services.instance_generator import InstanceGenerator
+from app.services.preferences_store import PreferencesStore, DEFAULT_USER
+from app.utils.compression import IDENTITY, negotiate_encoding, etag_matches
 from app.utils.config import (
     BASE_DIR,
     DEFAULT_OPENING_TIME,
@@ -160,17 +161,31 @@ async def submit_schedule_sync(
 # ── GET /schedule/{request_id} ─────────────────────────────────────────────
 
 @router.get("/schedule/{request_id}")
-async def get_schedule(request_id: str):
+async def get_schedule(request_id: str, request: Request):
     if not store.exists(request_id):
         raise HTTPException(status_code=404, detail="Request ID not found")
 
     entry = store.get(request_id)
 
     if entry["status"] == RequestStatus.COMPLETED:
-        return {
-            "request_id": request_id,
-            **entry["result"],
+        cached = entry["response"]
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        etag = cached.etag(encoding)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "private, max-age=0, must-revalidate",
+            "Vary": "Accept-Encoding",
         }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        if encoding != IDENTITY:
+            headers["Content-Encoding"] = encoding
+        return Response(
+            content=cached.encoded(encoding),
+            media_type="application/json",
+            headers=headers,
+        )
 
     if entry["status"] == RequestStatus.ERROR:
         raise HTTPException(
@@ -204,9 +219,11 @@ async def check_status(request_id: str):
 # ── GET /streams ────────────────────────────────────────────────────────────
 
 @router.get("/streams")
-async def list_streams(
-    probe: bool = Query(False, description="Probe each URL with yt-dlp (slow, ~15 s per stream)"),
+def list_streams(
+    probe: bool = Query(False, description="Probe each URL with yt-dlp (slow; probes run concurrently under a batch deadline)"),
 ):
+    # Plain def: FastAPI runs it in the threadpool, so a probe batch blocking
+    # until its deadline doesn't stall the event loop
     if probe:
         gen = InstanceGenerator()
         return {"streams": gen.probe_all_streams()}
@@ -249,17 +266,20 @@ class UserPreferences(BaseModel):
     selected_channel_ids: Optional[List[int]] = Field(default_factory=list, description="Selected channel IDs")
 
 
+preferences_store = PreferencesStore(PREFS_FILE, DEFAULT_PREFERENCES)
+
+
 @router.get("/preferences")
-async def get_preferences():
-    if PREFS_FILE.exists():
-        with open(PREFS_FILE, "r") as f:
-            return json.load(f)
-    return DEFAULT_PREFERENCES
+async def get_preferences(
+    user_id: str = Query(DEFAULT_USER, min_length=1, max_length=64, description="Preferences key"),
+):
+    return preferences_store.get(user_id)
 
 
 @router.post("/preferences")
-async def save_preferences(prefs: UserPreferences):
-    data = prefs.model_dump()
-    with open(PREFS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+async def save_preferences(
+    prefs: UserPreferences,
+    user_id: str = Query(DEFAULT_USER, min_length=1, max_length=64, description="Preferences key"),
+):
+    data = preferences_store.save(prefs.model_dump(), user_id)
     return {"status": "saved", "preferences": data}
\ No newline at end of file
@@ -6,9 +6,17 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.utils.config import API_TITLE, API_VERSION, API_DESCRIPTION
+from app.utils.config import (
+    API_TITLE,
+    API_VERSION,
+    API_DESCRIPTION,
+    RESPONSE_GZIP_MIN_SIZE,
+    LIVENESS_REFRESH_ENABLED,
+    DISCOVERY_ENABLED,
+)
 
 FRONTEND_DIST = Path(__file__).parent.parent / "frontend" / "dist"
 
@@ -29,7 +37,12 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag"],
     )
+
+    # Compress larger JSON responses; responses that already carry a
+    # Content-Encoding (e.g. cached schedule bodies) are passed through.
+    app.add_middleware(GZipMiddleware, minimum_size=RESPONSE_GZIP_MIN_SIZE)
     
     # Import and include routers
     try:
@@ -38,6 +51,54 @@ def create_app() -> FastAPI:
     except ImportError:
         print("Routes not yet implemented")
     
+    # Keep the liveness cache warm so schedule requests don't probe inline
+    from app.services.stream_refresher import create_refresher
+    refresher = create_refresher() if LIVENESS_REFRESH_ENABLED else None
+    app.state.stream_refresher = refresher
+    if refresher is not None:
+        @app.on_event("startup")
+        async def start_stream_refresher():
+            refresher.start()
+
+        @app.on_event("shutdown")
+        async def stop_stream_refresher():
+            await refresher.stop()
+
+    # Scan known channels for extra live streams off the request path
+    if DISCOVERY_ENABLED:
+        from app.services.stream_discovery import DiscoveryJob
+        discovery = DiscoveryJob()
+        discovery.load()
+        app.state.stream_discovery = discovery
+
+        @app.on_event("startup")
+        async def start_stream_discovery():
+            discovery.start()
+
+        @app.on_event("shutdown")
+        async def stop_stream_discovery():
+            await discovery.stop()
+
+    @app.on_event("shutdown")
+    async def close_http_clients():
+        from app.services.http_client import aclose_clients
+        await aclose_clients()
+
+    @app.on_event("shutdown")
+    def stop_ytdlp_pool():
+        from app.services import ytdlp_backend
+        ytdlp_backend.shutdown()
+
+    @app.on_event("shutdown")
+    def flush_caches():
+        from app.services.title_cache import title_cache
+        from app.services.liveness_cache import liveness_cache
+        from app.services.youtube_api import quota_ledger, search_cache
+        title_cache.close()
+        liveness_cache.save()
+        search_cache.save()
+        quota_ledger.save()
+
     @app.get("/")
     async def root():
         return {"message": "TV Scheduling API is running"}
@@ -0,0 +1,137 @@
+"""
+Shared HTTP clients for YouTube Data API and oEmbed calls.
+
+One pooled keep-alive ``httpx.Client`` (and an ``httpx.AsyncClient`` for
+async callers) is created lazily per process and reused, so repeated calls
+to googleapis.com / youtube.com skip the TCP + TLS handshake.  HTTP/2 is
+used when enabled in config and the ``h2`` package is installed.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.utils.config import (
+    YOUTUBE_HTTP_MAX_CONNECTIONS,
+    YOUTUBE_HTTP_MAX_KEEPALIVE,
+    YOUTUBE_HTTP_KEEPALIVE_EXPIRY,
+    YOUTUBE_HTTP_TIMEOUT,
+    YOUTUBE_HTTP_CONNECT_TIMEOUT,
+    YOUTUBE_HTTP2,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+_lock = threading.Lock()
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_enabled() -> bool:
+    if not YOUTUBE_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("YOUTUBE_HTTP2 is set but the 'h2' package is not installed — using HTTP/1.1")
+        return False
+    return True
+
+
+def _client_kwargs() -> Dict[str, Any]:
+    return {
+        "headers": _DEFAULT_HEADERS,
+        "http2": _http2_enabled(),
+        "limits": httpx.Limits(
+            max_connections=YOUTUBE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=YOUTUBE_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=YOUTUBE_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(YOUTUBE_HTTP_TIMEOUT, connect=YOUTUBE_HTTP_CONNECT_TIMEOUT),
+        "follow_redirects": True,
+    }
+
+
+def _request_timeout(timeout: Optional[float]) -> Any:
+    if timeout is None:
+        return httpx.USE_CLIENT_DEFAULT
+    return httpx.Timeout(timeout, connect=min(timeout, YOUTUBE_HTTP_CONNECT_TIMEOUT))
+
+
+def _decode_json(response: httpx.Response) -> Dict[str, Any]:
+    # The Data API reports errors as JSON bodies ({"error": {...}}), which the
+    # callers already handle — only fail on bodies that are not JSON at all.
+    try:
+        return response.json()
+    except ValueError:
+        response.raise_for_status()
+        raise
+
+
+# ── sync ────────────────────────────────────────────────────────────────────
+
+def get_client() -> httpx.Client:
+    """Return the process-wide pooled client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(**_client_kwargs())
+    return _client
+
+
+def get_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """GET ``url`` through the shared client and decode the JSON body."""
+    response = get_client().get(url, params=params, timeout=_request_timeout(timeout))
+    return _decode_json(response)
+
+
+def close_client() -> None:
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+# ── async ───────────────────────────────────────────────────────────────────
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled async client, creating it on first use."""
+    global _async_client
+    if _async_client is None:
+        with _lock:
+            if _async_client is None:
+                _async_client = httpx.AsyncClient(**_client_kwargs())
+    return _async_client
+
+
+async def aget_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Async counterpart of :func:`get_json`."""
+    response = await get_async_client().get(url, params=params, timeout=_request_timeout(timeout))
+    return _decode_json(response)
+
+
+async def aclose_clients() -> None:
+    """Close both clients; called from the application shutdown hook."""
+    global _async_client
+    with _lock:
+        client, _async_client = _async_client, None
+    if client is not None:
+        try:
+            await client.aclose()
+        except Exception as exc:  # e.g. created on a loop that is already closed
+            logger.debug("Failed to close async HTTP client cleanly: %s", exc)
+    close_client()
@@ -3,53 +3,65 @@ Instance Generator - Fetches real YouTube live stream info and converts
 scheduling parameters + streams into a complete JSON instance for the algorithm.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import os
 import re
+import shlex
 import random
+import hashlib
 import logging
 import subprocess
 import json
-import urllib.request
-import urllib.error
-import urllib.parse
-from datetime import datetime, timedelta
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
+from app.services import ytdlp_backend
+from app.services.http_client import get_json
+from app.services.liveness_cache import LivenessCache, liveness_cache
+from app.services.probe_engine import run_concurrently
+from app.services.title_cache import title_cache
+from app.services.youtube_api import (
+    COST_SEARCH_LIST,
+    COST_VIDEOS_LIST,
+    ApiUnavailable,
+    api_get,
+    degraded,
+    low_budget,
+    search_cache,
+)
+from app.utils.config import (
+    YOUTUBE_API_BASE_URL,
+    YOUTUBE_OEMBED_URL,
+    YTDLP_BACKEND,
+    YTDLP_COMMAND,
+    YTDLP_SOCKET_TIMEOUT,
+    TIMETABLE_CACHE_SIZE,
+    TITLE_NEGATIVE_TTL,
+    TITLE_RESOLVE_CONCURRENCY,
+    TITLE_RESOLVE_DEADLINE,
+)
+
 logger = logging.getLogger(__name__)
 
-# ── Title Cache ─────────────────────────────────────────────────────────────
-# Cache YouTube video titles by URL to avoid re-probing
-TITLE_CACHE_FILE = Path(__file__).parent.parent.parent / "title_cache.json"
-_title_cache: Dict[str, str] = {}
+_YT_OEMBED_API = YOUTUBE_OEMBED_URL
 
-def _load_title_cache() -> None:
-    global _title_cache
-    if TITLE_CACHE_FILE.exists():
-        try:
-            with open(TITLE_CACHE_FILE, "r", encoding="utf-8") as f:
-                _title_cache = json.load(f)
-            logger.info("Loaded %d cached titles", len(_title_cache))
-        except Exception as e:
-            logger.warning("Failed to load title cache: %s", e)
-            _title_cache = {}
-
-def _save_title_cache() -> None:
-    try:
-        with open(TITLE_CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(_title_cache, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        logger.warning("Failed to save title cache: %s", e)
+# ── Title Cache ─────────────────────────────────────────────────────────────
+# Cache YouTube video titles by URL to avoid re-probing (see title_cache.py).
+# Failed lookups are remembered for TITLE_NEGATIVE_TTL so a dead URL does
+# not cost an oEmbed round-trip on every request.  Expired failures serve no
+# stale fallback, so they are pruned as soon as they expire.
+_title_failures = LivenessCache(
+    None, ttl=0, negative_ttl=TITLE_NEGATIVE_TTL, max_age=TITLE_NEGATIVE_TTL
+)
 
 def get_cached_title(url: str) -> Optional[str]:
     """Get cached title for a YouTube URL."""
-    return _title_cache.get(url)
+    return title_cache.get(url)
 
 def cache_title(url: str, title: str) -> None:
-    """Cache a YouTube video title."""
-    if title and url:
-        _title_cache[url] = title
-        _save_title_cache()
+    """Cache a YouTube video title (written to disk in the background)."""
+    title_cache.put(url, title)
 
 
 def fetch_title_fast(url: str, timeout: float = 2.0) -> Optional[str]:
@@ -61,24 +73,59 @@ def fetch_title_fast(url: str, timeout: float = 2.0) -> Optional[str]:
     cached = get_cached_title(url)
     if cached:
         return cached
+    if _title_failures.lookup(url)[0]:
+        return None
 
     try:
-        oembed_url = f"https://www.youtube.com/oembed?url={urllib.request.quote(url, safe='')}&format=json"
-        req = urllib.request.Request(oembed_url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            title = data.get("title", "")
-            if title:
-                cache_title(url, title)
-                logger.debug("Fetched title via oEmbed: %s", title[:50])
-                return title
-    except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, Exception) as e:
+        data = get_json(_YT_OEMBED_API, params={"url": url, "format": "json"}, timeout=timeout)
+        title = data.get("title", "")
+        if title:
+            cache_title(url, title)
+            logger.debug("Fetched title via oEmbed: %s", title[:50])
+            return title
+    except Exception as e:
         logger.debug("oEmbed fetch failed for %s: %s", url, e)
+    _title_failures.set(url, None)
     return None
 
 
-# Load cache on module import
-_load_title_cache()
+def resolve_titles(urls: List[str], timeout: float = 2.0) -> Dict[str, str]:
+    """
+    Resolve titles for many URLs at once; returns url -> title for the ones found.
+
+    Cached titles are used as-is and recently failed URLs are skipped.  The
+    rest go through one videos.list snippet lookup per 50 IDs when the API is
+    usable, and whatever is still missing through a bounded set of concurrent
+    oEmbed fetches.
+    """
+    titles: Dict[str, str] = {}
+    pending: List[str] = []
+    for url in dict.fromkeys(urls):
+        cached = get_cached_title(url)
+        if cached:
+            titles[url] = cached
+        elif not _title_failures.lookup(url)[0]:
+            pending.append(url)
+
+    if pending and YOUTUBE_API_KEY and not degraded() and not low_budget():
+        with_ids = [url for url in pending if extract_video_id(url)]
+        for url, meta in check_live_status(with_ids).items():
+            if meta and meta.get("title"):
+                titles[url] = meta["title"]
+            elif meta is None:
+                _title_failures.set(url, None)  # the API says the video does not exist
+        pending = [url for url in pending if url not in titles and not _title_failures.lookup(url)[0]]
+
+    if pending:
+        fetched = run_concurrently(
+            lambda url: fetch_title_fast(url, timeout=timeout),
+            pending,
+            max_workers=TITLE_RESOLVE_CONCURRENCY,
+            deadline=TITLE_RESOLVE_DEADLINE,
+        )
+        titles.update({url: title for url, title in fetched.items() if title})
+
+    return titles
 
 
 def _load_project_env_file() -> None:
@@ -111,8 +158,8 @@ _load_project_env_file()
 # ── YouTube Data API v3 ─────────────────────────────────────────────────────
 # API key is read from environment (.env can be loaded by this module).
 YOUTUBE_API_KEY: str = os.environ.get("YOUTUBE_API_KEY", "")
-_YT_VIDEOS_API = "https://www.googleapis.com/youtube/v3/videos"
-_YT_SEARCH_API = "https://www.googleapis.com/youtube/v3/search"
+_YT_VIDEOS_API = f"{YOUTUBE_API_BASE_URL}/videos"
+_YT_SEARCH_API = f"{YOUTUBE_API_BASE_URL}/search"
 
 _VIDEO_ID_RE = re.compile(
     r"(?:youtube\.com/(?:watch\?(?:.*&)?v=|live/)|youtu\.be/)([A-Za-z0-9_-]{11})"
@@ -144,6 +191,59 @@ def batch_check_live_status(
 
     URLs that cannot be resolved or are not found are omitted from the result.
     """
+    results, _ = _batch_check_live_status(urls, api_key=api_key, timeout=timeout)
+    return results
+
+
+def check_live_status(
+    urls: List[str],
+    api_key: str = YOUTUBE_API_KEY,
+    timeout: float = 8.0,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Cache-aware variant of batch_check_live_status.
+
+    Fresh entries come from the shared liveness cache; only the rest hit the
+    API.  Returns url -> metadata, or url -> None for URLs the API answered
+    for but did not find (dead / private videos, negatively cached).  URLs
+    whose status is unknown (request failed, no video ID) are omitted.
+    When the daily quota runs low or the API circuit is open, stale cache
+    entries are served too.
+    """
+    cached, to_check = liveness_cache.get_many(urls, allow_stale=low_budget() or degraded())
+    if not to_check:
+        return cached
+
+    fresh = refresh_live_status(to_check, api_key=api_key, timeout=timeout)
+    return {**cached, **fresh}
+
+
+def refresh_live_status(
+    urls: List[str],
+    api_key: str = YOUTUBE_API_KEY,
+    timeout: float = 8.0,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Query the API for ``urls`` regardless of cache state and store the
+    outcome (including negative results) in the liveness cache.
+    """
+    results, not_found = _batch_check_live_status(urls, api_key=api_key, timeout=timeout)
+    fresh: Dict[str, Optional[Dict[str, Any]]] = dict(results)
+    for url in not_found:
+        fresh[url] = None
+    liveness_cache.set_many(fresh)
+    return fresh
+
+
+def _batch_check_live_status(
+    urls: List[str],
+    api_key: str,
+    timeout: float,
+) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """
+    Shared implementation: returns the resolved results plus the URLs that a
+    successful API response confirmed as not found.
+    """
     # Build id -> url mapping (deduplicated)
     id_to_url: Dict[str, str] = {}
     for url in urls:
@@ -152,26 +252,25 @@ def batch_check_live_status(
             id_to_url[vid_id] = url
 
     if not id_to_url:
-        return {}
+        return {}, []
 
     results: Dict[str, Dict[str, Any]] = {}
+    not_found: List[str] = []
 
     # The API supports up to 50 ids per request
     id_list = list(id_to_url.keys())
     for chunk_start in range(0, len(id_list), 50):
         chunk = id_list[chunk_start : chunk_start + 50]
-        params = urllib.parse.urlencode(
-            {
-                "part": "snippet,liveStreamingDetails",
-                "id": ",".join(chunk),
-                "key": api_key,
-            }
-        )
-        api_url = f"{_YT_VIDEOS_API}?{params}"
+        params = {
+            "part": "snippet,liveStreamingDetails",
+            "id": ",".join(chunk),
+            "key": api_key,
+        }
         try:
-            req = urllib.request.Request(api_url, headers={"User-Agent": "Mozilla/5.0"})
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
+            data = api_get(_YT_VIDEOS_API, params, COST_VIDEOS_LIST, timeout=timeout)
+        except ApiUnavailable as exc:
+            logger.warning("Skipping YouTube Data API check: %s", exc)
+            break
         except Exception as exc:
             logger.warning("YouTube Data API request failed: %s", exc)
             continue
@@ -219,7 +318,10 @@ def batch_check_live_status(
                 title[:50],
             )
 
-    return results
+        returned_ids = {item.get("id", "") for item in data.get("items", [])}
+        not_found.extend(id_to_url[vid_id] for vid_id in chunk if vid_id not in returned_ids)
+
+    return results, not_found
 
 
 def get_channel_live_video_id(
@@ -230,23 +332,29 @@ def get_channel_live_video_id(
     """
     Use YouTube Data API v3 search.list to find a currently live video on a channel.
     Returns the video ID of the first live stream, or None if the channel has no live stream.
+
+    search.list costs 100 quota units, so answers are cached per channel;
+    when the daily budget runs low a stale answer is preferred over a new call.
     """
     if not channel_id or not channel_id.strip():
         return None
-    params = urllib.parse.urlencode(
-        {
-            "part": "snippet",
-            "channelId": channel_id.strip(),
-            "eventType": "live",
-            "type": "video",
-            "key": api_key,
-        }
-    )
-    api_url = f"{_YT_SEARCH_API}?{params}"
+    channel_id = channel_id.strip()
+    hit, cached = search_cache.lookup(channel_id, allow_stale=low_budget() or degraded())
+    if hit:
+        return cached["video_id"] if cached else None
+
+    params = {
+        "part": "snippet",
+        "channelId": channel_id,
+        "eventType": "live",
+        "type": "video",
+        "key": api_key,
+    }
     try:
-        req = urllib.request.Request(api_url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+        data = api_get(_YT_SEARCH_API, params, COST_SEARCH_LIST, timeout=timeout)
+    except ApiUnavailable as exc:
+        logger.warning("Skipping live search for channel %s: %s", channel_id, exc)
+        return None
     except Exception as exc:
         logger.warning("YouTube Search API request failed for channel %s: %s", channel_id, exc)
         return None
@@ -257,10 +365,9 @@ def get_channel_live_video_id(
         )
         return None
     items = data.get("items", [])
-    if not items:
-        return None
     # First result is a live video
-    video_id = items[0].get("id", {}).get("videoId")
+    video_id = items[0].get("id", {}).get("videoId") if items else None
+    search_cache.set(channel_id, {"video_id": video_id} if video_id else None)
     if video_id:
         logger.debug("Channel %s has live video: %s", channel_id, video_id)
     return video_id
@@ -501,6 +608,44 @@ YOUTUBE_STREAMS = {
     ],
 }
 
+# Channels scanned by the background discovery job for additional live streams
+KNOWN_CHANNELS = {
+    "https://www.youtube.com/channel/UC3prwMn9aU2z5Y158ZdGyyA": "technology",  # Crux
+    "https://www.youtube.com/channel/UCmk6ZFMy1CT80orXca4tKew": "technology",  # Financial Express
+    "https://www.youtube.com/channel/UCkvW_7kp9LJrztmgA4q4bJQ": "technology",  # Sen
+    "https://www.youtube.com/channel/UCetYFjkhf7S7LwiuJxeC28g": "technology",  # Dream Trips
+    "https://www.youtube.com/@JoeyDoesTech": "technology",  # Joey Does Tech
+    "https://www.youtube.com/channel/UCLA_DiR1FfKNvjuUpBHmylQ": "science",  # NASA
+    "https://www.youtube.com/channel/UCOazV478JlUdvbBgFN4wWXA": "science",  # NASASpaceflight
+    "https://www.youtube.com/channel/UC-QRPODUcdhXzXiOxsOaouA": "science",  # afarTV
+    "https://www.youtube.com/channel/UCkWQ0gDr4bzT7Tu2xR_AV0Q": "science",  # Space Streams
+    "https://www.youtube.com/channel/UC9c3bXN57i-FuKiPi5I3vhQ": "science",  # Frontiers of Infinity
+    "https://www.youtube.com/channel/UCO-cfMjj6FM8WztlNSoVBGg": "science",  # Interstellar News Hub
+    "https://www.youtube.com/@Astro.Horizons": "science",  # Astro Horizons
+    "https://www.youtube.com/channel/UCMpn1qLudF-zb4M4bqxLIbw": "climate",  # I Love You Venice
+}
+
+# Streams found by channel discovery, shared by every generator in the process.
+# Replaced wholesale by the discovery job; requests only ever read it.
+_discovered_streams: List[Dict[str, Any]] = []
+
+
+def get_discovered_streams() -> List[Dict[str, Any]]:
+    return list(_discovered_streams)
+
+
+def set_discovered_streams(streams: List[Dict[str, Any]]) -> None:
+    global _discovered_streams
+    _discovered_streams = list(streams)
+
+
+def known_stream_urls() -> List[str]:
+    """URLs of every hardcoded and discovered stream (for background refreshes)."""
+    urls = [s["url"] for cat in YOUTUBE_STREAMS.values() for s in cat]
+    urls.extend(s["url"] for s in list(_discovered_streams))
+    return list(dict.fromkeys(urls))
+
+
 # Base score per category – used when generating program scores
 CATEGORY_SCORES = {
     "technology": 75,
@@ -510,6 +655,35 @@ CATEGORY_SCORES = {
 }
 
 
+# ── Channel timetables ──────────────────────────────────────────────────────
+# A timetable is the sequence of (start, end, score_delta) slots filling the
+# opening window for one stream.  It is generated from a RNG seeded with
+# (url, opening_time, closing_time, min_duration, day), so identical requests
+# on the same day yield identical instances, and memoised with LRU eviction.
+
+@lru_cache(maxsize=TIMETABLE_CACHE_SIZE)
+def generate_timetable(
+    url: str,
+    opening_time: int,
+    closing_time: int,
+    min_duration: int,
+    day: str,
+) -> Tuple[Tuple[int, int, int], ...]:
+    key = f"{url}|{opening_time}|{closing_time}|{min_duration}|{day}"
+    rng = random.Random(int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big"))
+
+    slots: List[Tuple[int, int, int]] = []
+    current_time = opening_time
+    while current_time < closing_time:
+        remaining = closing_time - current_time
+        if remaining < min_duration:
+            break
+        duration = min(min_duration + rng.randint(0, 60), remaining)
+        slots.append((current_time, current_time + duration, rng.randint(-10, 10)))
+        current_time += duration
+    return tuple(slots)
+
+
 # ── YouTube live-stream probing ─────────────────────────────────────────────
 
 def probe_youtube_stream(url: str, timeout: int = 15) -> Optional[Dict[str, Any]]:
@@ -536,27 +710,15 @@ def probe_youtube_stream(url: str, timeout: int = 15) -> Optional[Dict[str, Any]
 
     # ── Fallback: yt-dlp ─────────────────────────────────────────────────
     try:
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "yt_dlp",
-                "--dump-json",
-                "--no-download",
-                "--no-playlist",
-                "--socket-timeout",
-                "10",
-                url,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-        if result.returncode != 0:
-            logger.warning("yt-dlp failed for %s: %s", url, result.stderr[:200])
+        if _use_inprocess_ytdlp():
+            info = ytdlp_backend.extract_info(url, timeout=timeout)
+        else:
+            info = _run_ytdlp_subprocess(["--no-playlist", url], timeout)
+            info = json.loads(info) if info is not None else None
+        if not info:
+            logger.warning("yt-dlp returned no data for %s", url)
             return None
 
-        info = json.loads(result.stdout)
         title = info.get("title", "")
         if title:
             cache_title(url, title)
@@ -570,7 +732,7 @@ def probe_youtube_stream(url: str, timeout: int = 15) -> Optional[Dict[str, Any]
             "channel_id": info.get("channel_id", ""),
             "channel_url": info.get("channel_url", ""),
         }
-    except subprocess.TimeoutExpired:
+    except (subprocess.TimeoutExpired, ytdlp_backend.ExtractionTimeout):
         logger.warning("yt-dlp timed out for %s", url)
         return None
     except Exception as exc:
@@ -586,57 +748,49 @@ def discover_channel_live_streams(channel_url: str, max_streams: int = 5, timeou
     try:
         streams_url = f"{channel_url}/streams"
 
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "yt_dlp",
-                "--dump-json",
-                "--no-download",
-                "--playlist-end",
-                str(max_streams),
-                "--socket-timeout",
-                "10",
-                "--match-filter",
-                "is_live",
-                streams_url,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-
-        if result.returncode != 0:
-            logger.debug(f"No additional live streams found on {channel_url}")
-            return []
+        if _use_inprocess_ytdlp():
+            playlist = ytdlp_backend.extract_info(
+                streams_url, timeout=timeout, playlist_end=max_streams, live_only=True
+            )
+            entries = [e for e in (playlist or {}).get("entries") or [] if e]
+        else:
+            output = _run_ytdlp_subprocess(
+                ["--playlist-end", str(max_streams), "--match-filter", "is_live", streams_url],
+                timeout,
+            )
+            if output is None:
+                logger.debug(f"No additional live streams found on {channel_url}")
+                return []
+            entries = []
+            for line in output.strip().split("\n"):
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
 
         discovered = []
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            try:
-                info = json.loads(line)
-                if info.get("is_live", False):
-                    discovered.append(
-                        {
-                            "title": info.get("title", ""),
-                            "url": f"https://www.youtube.com/watch?v={info.get('id', '')}",
-                            "is_live": True,
-                            "uploader": info.get("uploader", ""),
-                            "view_count": info.get("view_count", 0),
-                            "channel_id": info.get("channel_id", ""),
-                            "channel_url": info.get("channel_url", ""),
-                        }
-                    )
-            except json.JSONDecodeError:
-                continue
+        for info in entries:
+            if info.get("is_live", False):
+                discovered.append(
+                    {
+                        "title": info.get("title", ""),
+                        "url": f"https://www.youtube.com/watch?v={info.get('id', '')}",
+                        "is_live": True,
+                        "uploader": info.get("uploader", ""),
+                        "view_count": info.get("view_count", 0),
+                        "channel_id": info.get("channel_id", ""),
+                        "channel_url": info.get("channel_url", ""),
+                    }
+                )
 
         if discovered:
             logger.info(f"Discovered {len(discovered)} additional live stream(s) from {channel_url}")
 
         return discovered
 
-    except subprocess.TimeoutExpired:
+    except (subprocess.TimeoutExpired, ytdlp_backend.ExtractionTimeout):
         logger.warning(f"Timeout discovering streams from {channel_url}")
         return []
     except Exception as exc:
@@ -644,6 +798,31 @@ def discover_channel_live_streams(channel_url: str, max_streams: int = 5, timeou
         return []
 
 
+def _use_inprocess_ytdlp() -> bool:
+    return YTDLP_BACKEND == "inprocess" and ytdlp_backend.available()
+
+
+def _run_ytdlp_subprocess(args: List[str], timeout: float) -> Optional[str]:
+    """Run ``YTDLP_COMMAND --dump-json`` and return stdout, or None on failure."""
+    result = subprocess.run(
+        [
+            *shlex.split(YTDLP_COMMAND),
+            "--dump-json",
+            "--no-download",
+            "--socket-timeout",
+            str(YTDLP_SOCKET_TIMEOUT),
+            *args,
+        ],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        logger.debug("yt-dlp exited with %d: %s", result.returncode, result.stderr[:200])
+        return None
+    return result.stdout
+
+
 # ── Instance Generator ──────────────────────────────────────────────────────
 
 class InstanceGenerator:
@@ -654,12 +833,6 @@ class InstanceGenerator:
     def __init__(self):
         self.streams = self._get_all_streams()
         self.category_scores = CATEGORY_SCORES
-        # Cache keyed on URL so we don't probe the same stream twice
-        self._probe_cache: Dict[str, Optional[Dict[str, Any]]] = {}
-        # Track discovered streams to avoid duplicates
-        self._discovered_streams: List[Dict[str, Any]] = []
-        # Track timestamp of last discovery run
-        self._discovery_metadata_file = Path(__file__).parent.parent / ".discovery_metadata.json"
 
     # ── helpers ─────────────────────────────────────────────────────────
 
@@ -671,131 +844,22 @@ class InstanceGenerator:
         return all_streams
 
     def _probe(self, url: str) -> Optional[Dict[str, Any]]:
-        """Probe a URL (with caching)."""
-        if url not in self._probe_cache:
-            self._probe_cache[url] = probe_youtube_stream(url)
-        return self._probe_cache[url]
-
-    def _get_last_discovery_time(self) -> Optional[datetime]:
-        """
-        Retrieve the timestamp of when discovery was last run.
-        Returns None if no discovery has been run yet.
-        """
-        if not self._discovery_metadata_file.exists():
-            return None
-        try:
-            with open(self._discovery_metadata_file, 'r') as f:
-                data = json.load(f)
-            timestamp_str = data.get("last_discovery_time")
-            if timestamp_str:
-                return datetime.fromisoformat(timestamp_str)
-        except Exception as e:
-            logger.warning("Could not read discovery metadata: %s", e)
-        return None
-
-    def _should_discover_now(self) -> bool:
-        """
-        Check if 24 hours have passed since last discovery.
-        Returns True if discovery should run now.
-        """
-        last_time = self._get_last_discovery_time()
-        if last_time is None:
-            # First time — should discover now
-            logger.info("First discovery run detected")
-            return True
-
-        elapsed = datetime.now() - last_time
-        should_run = elapsed >= timedelta(hours=24)
-        hours_since = int(elapsed.total_seconds() // 3600)
-        if should_run:
-            logger.info("24 hours have passed since last discovery (%d hours). Running discovery now.", hours_since)
-        else:
-            hours_until_next = max(1, int((timedelta(hours=24) - elapsed).total_seconds() // 3600))
-            logger.info("Last discovery was %d hours ago. Next discovery in about %d hour(s).", hours_since, hours_until_next)
-        return should_run
-
-    def _update_discovery_time(self) -> None:
-        """
-        Update the timestamp to mark when discovery was just run.
-        """
-        try:
-            self._discovery_metadata_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._discovery_metadata_file, 'w') as f:
-                json.dump({
-                    "last_discovery_time": datetime.now().isoformat(),
-                    "note": "Auto-discovery runs every 24 hours to find new live streams"
-                }, f, indent=2)
-            logger.info("Updated discovery timestamp")
-        except Exception as e:
-            logger.error("Could not update discovery metadata: %s", e)
-
-    def _discover_additional_streams(self) -> List[Dict[str, Any]]:
-        """
-        Discover additional live streams from the same channels as hardcoded streams.
-        """
-        KNOWN_CHANNELS = {
-            "https://www.youtube.com/channel/UC3prwMn9aU2z5Y158ZdGyyA": "technology",  # Crux
-            "https://www.youtube.com/channel/UCmk6ZFMy1CT80orXca4tKew": "technology",  # Financial Express
-            "https://www.youtube.com/channel/UCkvW_7kp9LJrztmgA4q4bJQ": "technology",  # Sen
-            "https://www.youtube.com/channel/UCetYFjkhf7S7LwiuJxeC28g": "technology",  # Dream Trips
-            "https://www.youtube.com/@JoeyDoesTech": "technology",  # Joey Does Tech
-            "https://www.youtube.com/channel/UCLA_DiR1FfKNvjuUpBHmylQ": "science",  # NASA
-            "https://www.youtube.com/channel/UCOazV478JlUdvbBgFN4wWXA": "science",  # NASASpaceflight
-            "https://www.youtube.com/channel/UC-QRPODUcdhXzXiOxsOaouA": "science",  # afarTV
-            "https://www.youtube.com/channel/UCkWQ0gDr4bzT7Tu2xR_AV0Q": "science",  # Space Streams
-            "https://www.youtube.com/channel/UC9c3bXN57i-FuKiPi5I3vhQ": "science",  # Frontiers of Infinity
-            "https://www.youtube.com/channel/UCO-cfMjj6FM8WztlNSoVBGg": "science",  # Interstellar News Hub
-            "https://www.youtube.com/@Astro.Horizons": "science",  # Astro Horizons
-            "https://www.youtube.com/channel/UCMpn1qLudF-zb4M4bqxLIbw": "climate",  # I Love You Venice
-        }
-
-        discovered_streams = []
-        seen_urls = {s["url"] for s in self.streams}
-
-        logger.info(f"Discovering live streams from {len(KNOWN_CHANNELS)} known channels...")
-
-        for channel_url, category in KNOWN_CHANNELS.items():
-            try:
-                logger.debug(f"Checking {channel_url} for additional live streams...")
-                new_streams = discover_channel_live_streams(channel_url, max_streams=3, timeout=15)
-
-                for new_stream in new_streams:
-                    new_url = new_stream["url"]
-
-                    if new_url in seen_urls:
-                        logger.debug(f"Skipping duplicate: {new_url}")
-                        continue
-
-                    discovered_streams.append(
-                        {
-                            "channel_id": len(self.streams) + len(discovered_streams),
-                            "title": new_stream["title"],
-                            "url": new_url,
-                            "category": category,
-                        }
-                    )
-                    seen_urls.add(new_url)
-                    logger.info(f"Discovered new {category} stream: {new_stream['title']}")
-
-            except Exception as e:
-                logger.warning(f"Failed to discover from {channel_url}: {e}")
-                continue
-
-        if discovered_streams:
-            logger.info(f"Discovery complete: found {len(discovered_streams)} additional streams")
-        else:
-            logger.info("No additional live streams discovered")
-
-        return discovered_streams
+        """Probe a URL through the shared liveness cache."""
+        hit, meta = liveness_cache.lookup(url)
+        if not hit:
+            meta = probe_youtube_stream(url)
+            liveness_cache.set(url, meta)
+        return meta
 
     def probe_all_streams(self) -> List[Dict[str, Any]]:
         """
         Probe every hardcoded stream and return enriched info.
         Useful for the GET /api/streams endpoint.
         """
+        probed = run_concurrently(self._probe, [s["url"] for s in self.streams])
         results = []
         for stream in self.streams:
-            meta = self._probe(stream["url"])
+            meta = probed.get(stream["url"])
             entry = {**stream, "probed": meta is not None}
             if meta:
                 entry["live_title"] = meta["title"]
@@ -815,17 +879,9 @@ class InstanceGenerator:
     ) -> Dict[str, Any]:
         """
         Build a full instance JSON ready for the beam-search algorithm.
-        Automatically enables discovery if 24 hours have passed since last discovery.
+        With discover_new_streams, streams found by the background discovery
+        job (see stream_discovery.py) are added to the candidates.
         """
-        # AUTO-DISCOVERY: Check if 24 hours have passed
-        should_discover_now = self._should_discover_now()
-        if should_discover_now:
-            logger.info("Auto-enabling discovery — 24 hours since last discovery run")
-            discover_new_streams = True
-        elif discover_new_streams:
-            logger.info("Discovery requested but 24-hour interval not reached yet. Skipping discovery for this run.")
-            discover_new_streams = False
-        
         opening_time = scheduling_params["opening_time"]
         closing_time = scheduling_params["closing_time"]
         min_duration = scheduling_params["min_duration"]
@@ -881,19 +937,14 @@ class InstanceGenerator:
             )
             available_streams = self.streams.copy()
 
-        # Optionally discover additional live streams from the same channels
+        # Optionally add live streams found by the background discovery job
         if discover_new_streams:
-            logger.info("Discovering additional live streams from channels...")
-            discovered = self._discover_additional_streams()
+            discovered = get_discovered_streams()
             if discovered:
-                logger.info(f"Found {len(discovered)} additional live stream(s)")
+                logger.info("Adding %d discovered live stream(s)", len(discovered))
                 available_streams.extend(discovered)
-                # Update discovery timestamp after successful discovery
-                self._update_discovery_time()
             else:
                 logger.info("No additional live streams discovered")
-                # Still update timestamp even if no new streams found
-                self._update_discovery_time()
 
         total_streams = len(available_streams)
         channels_count = max(1, min(requested_channels, total_streams))
@@ -918,9 +969,22 @@ class InstanceGenerator:
             "Batch-checking live status for %d streams via YouTube Data API v3 (only live streams will be included)...",
             len(selected_urls),
         )
-        api_results = batch_check_live_status(selected_urls)
+        checked = check_live_status(selected_urls)
+        api_results = {url: meta for url, meta in checked.items() if meta is not None}
+
+        # For any URL not returned by the API, optionally use yt-dlp; otherwise skip (do not include).
+        # URLs the API confirmed as missing are negatively cached and not re-probed.
+        # While the API circuit is open YouTube is treated as degraded and the
+        # (slow) yt-dlp fallback is skipped as well.
+        fallback_results: Dict[str, Optional[Dict[str, Any]]] = {}
+        if probe_streams:
+            missed_urls = [url for url in selected_urls if url not in checked]
+            if missed_urls and degraded():
+                logger.warning("YouTube API degraded — not probing %d unresolved stream(s) with yt-dlp", len(missed_urls))
+            elif missed_urls:
+                logger.debug("API missed %d stream(s) — probing concurrently with yt-dlp", len(missed_urls))
+                fallback_results = run_concurrently(self._probe, missed_urls)
 
-        # For any URL not returned by the API, optionally use yt-dlp; otherwise skip (do not include)
         for s in selected_streams:
             url = s["url"]
             if url in api_results:
@@ -934,9 +998,10 @@ class InstanceGenerator:
                     meta["title"][:60],
                 )
             else:
-                if probe_streams:
-                    logger.debug("API missed %s — using yt-dlp fallback", url)
-                    meta = self._probe(url)
+                if url in checked:
+                    logger.info("Stream %s (%s) not found or unavailable — skipping", s.get("channel_id", "?"), url)
+                elif probe_streams:
+                    meta = fallback_results.get(url)
                     stream_metadata[url] = meta
                     if meta:
                         logger.info(
@@ -953,8 +1018,7 @@ class InstanceGenerator:
 
         # ── Keep only LIVE streams; never include upcoming / ended in instance or schedule ─────────────────
         live_streams: List[Dict[str, Any]] = []
-        discovered_alternatives: List[Dict[str, Any]] = []
-        seen_urls = {s["url"] for s in selected_streams}
+        offline_with_channel: List[Tuple[Dict[str, Any], str]] = []
 
         for s in selected_streams:
             meta = stream_metadata.get(s["url"])
@@ -970,35 +1034,9 @@ class InstanceGenerator:
                     s.get("title", "unknown"),
                     s["url"],
                 )
-                # Try to find a currently live stream from the same channel via YouTube Data API
                 yt_channel_id = meta.get("channel_id") or _channel_id_from_url(meta.get("channel_url") or "")
                 if yt_channel_id:
-                    live_video_id = get_channel_live_video_id(yt_channel_id)
-                    if live_video_id:
-                        alt_url = f"https://www.youtube.com/watch?v={live_video_id}"
-                        if alt_url not in seen_urls:
-                            alt_check = batch_check_live_status([alt_url])
-                            alt_meta = alt_check.get(alt_url)
-                            if alt_meta and alt_meta.get("is_live"):
-                                alt_stream = {
-                                    "channel_id": s["channel_id"],
-                                    "title": alt_meta.get("title", ""),
-                                    "url": alt_url,
-                                    "category": s["category"],
-                                }
-                                discovered_alternatives.append(alt_stream)
-                                stream_metadata[alt_url] = alt_meta
-                                seen_urls.add(alt_url)
-                                logger.info(
-                                    "Found live alternative: %s (%s)",
-                                    alt_meta.get("title", "")[:60],
-                                    alt_url,
-                                )
-                    else:
-                        logger.info(
-                            "Channel has no live stream — skipping: %s",
-                            s.get("title", "unknown"),
-                        )
+                    offline_with_channel.append((s, yt_channel_id))
                 else:
                     logger.info(
                         "No channel ID for offline stream — skipping: %s",
@@ -1011,6 +1049,50 @@ class InstanceGenerator:
                     s["url"],
                 )
 
+        # Try to find a currently live stream from the same channel via YouTube Data API.
+        # One search per distinct channel, then a single videos.list call verifies
+        # every candidate alternative at once.
+        live_video_ids = {
+            channel: get_channel_live_video_id(channel)
+            for channel in dict.fromkeys(channel for _, channel in offline_with_channel)
+        }
+        seen_urls = {s["url"] for s in selected_streams}
+        alt_urls = [
+            f"https://www.youtube.com/watch?v={video_id}"
+            for video_id in live_video_ids.values()
+            if video_id
+        ]
+        alt_checked = check_live_status([url for url in alt_urls if url not in seen_urls])
+
+        discovered_alternatives: List[Dict[str, Any]] = []
+        for s, yt_channel_id in offline_with_channel:
+            live_video_id = live_video_ids.get(yt_channel_id)
+            if not live_video_id:
+                logger.info(
+                    "Channel has no live stream — skipping: %s",
+                    s.get("title", "unknown"),
+                )
+                continue
+            alt_url = f"https://www.youtube.com/watch?v={live_video_id}"
+            if alt_url in seen_urls:
+                continue
+            alt_meta = alt_checked.get(alt_url)
+            if alt_meta and alt_meta.get("is_live"):
+                alt_stream = {
+                    "channel_id": s["channel_id"],
+                    "title": alt_meta.get("title", ""),
+                    "url": alt_url,
+                    "category": s["category"],
+                }
+                discovered_alternatives.append(alt_stream)
+                stream_metadata[alt_url] = alt_meta
+                seen_urls.add(alt_url)
+                logger.info(
+                    "Found live alternative: %s (%s)",
+                    alt_meta.get("title", "")[:60],
+                    alt_url,
+                )
+
         live_streams.extend(discovered_alternatives)
 
         if not live_streams:
@@ -1024,11 +1106,20 @@ class InstanceGenerator:
             )
             selected_streams = live_streams
 
+        # Resolve every missing video title up front in one batch
+        titles = resolve_titles([
+            stream["url"]
+            for stream in selected_streams
+            if not (stream_metadata.get(stream["url"]) or {}).get("title")
+        ])
+
         # Build channels
         channels = []
         for stream in selected_streams:
             meta = stream_metadata.get(stream["url"])
-            channel = self._generate_channel(stream, opening_time, closing_time, min_duration, meta)
+            channel = self._generate_channel(
+                stream, opening_time, closing_time, min_duration, meta, titles.get(stream["url"])
+            )
             channels.append(channel)
 
         instance = {
@@ -1054,6 +1145,7 @@ class InstanceGenerator:
         closing_time: int,
         min_duration: int,
         meta: Optional[Dict[str, Any]] = None,
+        video_title: Optional[str] = None,
     ) -> Dict[str, Any]:
         channel_id = stream["channel_id"]
         category = stream["category"]
@@ -1061,7 +1153,9 @@ class InstanceGenerator:
         channel_name = (meta["uploader"] if meta and meta.get("uploader") else None) or stream["title"]
         url = stream["url"]
 
-        programs = self._generate_programs(channel_id, channel_name, category, url, opening_time, closing_time, min_duration, meta)
+        programs = self._generate_programs(
+            channel_id, channel_name, category, url, opening_time, closing_time, min_duration, meta, video_title
+        )
         return {"channel_id": channel_id, "channel_name": channel_name, "programs": programs}
 
     def _select_streams(
@@ -1147,47 +1241,36 @@ class InstanceGenerator:
         closing_time: int,
         min_duration: int,
         meta: Optional[Dict[str, Any]] = None,
+        video_title: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Fill the [opening_time, closing_time) window with sequential programs for one channel.
+        Slot boundaries and score jitter come from the cached, seeded timetable.
+        ``video_title`` is used when the probe metadata has no title (see resolve_titles).
         """
         programs: List[Dict[str, Any]] = []
-        current_time = opening_time
-        program_count = 0
         base_score = self.category_scores.get(category, 75)
 
         is_live = meta["is_live"] if meta else False
         live_bonus = 10 if is_live else 0
-        # Get the actual YouTube video title from metadata, cache, or fast oEmbed fetch
-        video_title = ""
+        # Use the actual YouTube video title from metadata, else the batch-resolved one
         if meta and meta.get("title"):
             video_title = meta["title"]
-        else:
-            # Try to get from cache (previously probed) or fetch via fast oEmbed API
-            video_title = fetch_title_fast(url) or ""
-
-        while current_time < closing_time:
-            remaining = closing_time - current_time
-            if remaining < min_duration:
-                break
-
-            duration = min(min_duration + random.randint(0, 60), remaining)
-            program_end = current_time + duration
-            score = max(40, base_score + live_bonus + random.randint(-10, 10))
+        video_title = video_title or ""
 
+        timetable = generate_timetable(url, opening_time, closing_time, min_duration, date.today().isoformat())
+        for program_count, (start, end, score_delta) in enumerate(timetable):
             programs.append(
                 {
                     "program_id": f"{title}_program_{program_count}",
                     "program_name": video_title if video_title else f"{title} program {program_count}",
-                    "start": current_time,
-                    "end": program_end,
+                    "start": start,
+                    "end": end,
                     "genre": category,
-                    "score": score,
+                    "score": max(40, base_score + live_bonus + score_delta),
                     "url": url,
                 }
             )
-            current_time = program_end
-            program_count += 1
 
         return programs
 
@@ -0,0 +1,199 @@
+"""
+Process-wide cache of stream liveness / metadata, keyed by URL.
+
+Every entry records when it was checked.  Positive entries (metadata dicts)
+expire after ``LIVENESS_TTL`` seconds; negative entries (``None`` — the URL is
+dead, private or could not be resolved) after ``LIVENESS_NEGATIVE_TTL``.
+Expired entries are kept around (up to ``LIVENESS_CACHE_MAX_AGE``) so callers
+can still fall back to stale data when YouTube is unreachable; older ones are
+pruned on write, at most once a minute, so an in-memory-only cache stays
+bounded too.
+
+The cache is persisted to ``liveness_cache.json`` a few seconds after it
+changes and at shutdown, so a restarted process starts warm.
+"""
+
+import atexit
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.utils.config import (
+    LIVENESS_CACHE_FILE,
+    LIVENESS_TTL,
+    LIVENESS_NEGATIVE_TTL,
+    LIVENESS_CACHE_MAX_AGE,
+    LIVENESS_CACHE_SAVE_INTERVAL,
+)
+from app.utils.file_handler import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+Meta = Optional[Dict[str, Any]]
+
+# Seconds between in-memory sweeps of entries older than max_age
+PRUNE_INTERVAL = 60
+
+
+class LivenessCache:
+    """Thread-safe TTL cache with negative entries and disk persistence."""
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        ttl: float = LIVENESS_TTL,
+        negative_ttl: float = LIVENESS_NEGATIVE_TTL,
+        max_age: float = LIVENESS_CACHE_MAX_AGE,
+        save_interval: float = LIVENESS_CACHE_SAVE_INTERVAL,
+    ):
+        self._path = Path(path) if path else None
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_age = max_age
+        self._save_interval = save_interval
+
+        self._lock = threading.RLock()
+        # url -> (meta or None, checked_at epoch seconds)
+        self._entries: Dict[str, Tuple[Meta, float]] = {}
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._last_prune = time.time()
+
+    # ── read ────────────────────────────────────────────────────────────
+
+    def lookup(self, url: str, allow_stale: bool = False) -> Tuple[bool, Meta]:
+        """
+        Return ``(hit, meta)``.  ``meta`` is ``None`` for a negative hit.
+        With ``allow_stale`` any remembered entry counts as a hit.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            return False, None
+        meta, checked_at = entry
+        if allow_stale or not self._expired(meta, checked_at):
+            return True, meta
+        return False, None
+
+    def get_many(self, urls: Iterable[str], allow_stale: bool = False) -> Tuple[Dict[str, Meta], List[str]]:
+        """Split ``urls`` into cached entries and URLs that need a fresh check."""
+        hits: Dict[str, Meta] = {}
+        misses: List[str] = []
+        for url in dict.fromkeys(urls):
+            hit, meta = self.lookup(url, allow_stale=allow_stale)
+            if hit:
+                hits[url] = meta
+            else:
+                misses.append(url)
+        return hits, misses
+
+    def age(self, url: str) -> Optional[float]:
+        """Seconds since ``url`` was last checked, or None if never."""
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            return None
+        return time.time() - entry[1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # ── write ───────────────────────────────────────────────────────────
+
+    def set(self, url: str, meta: Meta) -> None:
+        self.set_many({url: meta})
+
+    def set_many(self, results: Dict[str, Meta]) -> None:
+        if not results:
+            return
+        now = time.time()
+        with self._lock:
+            for url, meta in results.items():
+                self._entries[url] = (meta, now)
+            if now - self._last_prune >= PRUNE_INTERVAL:
+                self._prune_locked(now)
+            self._dirty = True
+            self._schedule_save()
+
+    # ── persistence ─────────────────────────────────────────────────────
+
+    def load(self) -> None:
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Failed to load liveness cache: %s", exc)
+            return
+
+        now = time.time()
+        loaded: Dict[str, Tuple[Meta, float]] = {}
+        for url, entry in (data.get("entries") or {}).items():
+            try:
+                meta, checked_at = entry["meta"], float(entry["checked_at"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if now - checked_at <= self._max_age:
+                loaded[url] = (meta, checked_at)
+
+        with self._lock:
+            loaded.update(self._entries)
+            self._entries = loaded
+        logger.info("Loaded %d cached stream liveness entries", len(loaded))
+
+    def save(self) -> None:
+        with self._lock:
+            self._cancel_timer()
+            if self._path is None or not self._dirty:
+                return
+            self._prune_locked(time.time())
+            data = {
+                "entries": {
+                    url: {"meta": meta, "checked_at": checked_at}
+                    for url, (meta, checked_at) in self._entries.items()
+                }
+            }
+            self._dirty = False
+        try:
+            atomic_write_json(data, self._path, indent=None)
+        except OSError as exc:
+            logger.warning("Failed to save liveness cache: %s", exc)
+            with self._lock:
+                self._dirty = True
+
+    # ── internals ───────────────────────────────────────────────────────
+
+    def _expired(self, meta: Meta, checked_at: float) -> bool:
+        ttl = self._ttl if meta is not None else self._negative_ttl
+        return time.time() - checked_at > ttl
+
+    def _prune_locked(self, now: float) -> None:
+        """Drop entries older than ``max_age`` (caller holds the lock)."""
+        self._entries = {
+            url: entry for url, entry in self._entries.items()
+            if now - entry[1] <= self._max_age
+        }
+        self._last_prune = now
+
+    def _schedule_save(self) -> None:
+        if self._path is not None and self._timer is None:
+            self._timer = threading.Timer(self._save_interval, self.save)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            if self._timer is not threading.current_thread():
+                self._timer.cancel()
+            self._timer = None
+
+
+# Singleton used across the app
+liveness_cache = LivenessCache(LIVENESS_CACHE_FILE)
+liveness_cache.load()
+atexit.register(liveness_cache.save)
@@ -0,0 +1,92 @@
+"""
+Preferences store — per-user filter preferences backed by a single JSON file.
+
+Reads are served from memory; the file is only re-parsed when its mtime or
+size changes (e.g. edited by hand or written by another worker).  Writes go
+through a temp file + rename under a lock, so a crash or a concurrent save
+can never leave a torn file behind.
+
+File layout:
+    {"users": {"default": {...}, "<user_id>": {...}}}
+
+A legacy flat document (the preferences object itself) is read as the
+"default" user and rewritten in the new layout on the next save.
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from app.utils.file_handler import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER = "default"
+
+
+class PreferencesStore:
+    """Thread-safe, mtime-validated cache over the preferences file."""
+
+    def __init__(self, path: Path, defaults: Dict[str, Any]):
+        self._path = Path(path)
+        self._defaults = defaults
+        self._lock = threading.Lock()
+        self._users: Dict[str, Dict[str, Any]] = {}
+        self._signature: Optional[Tuple[int, int]] = None
+
+    # ── read ────────────────────────────────────────────────────────────
+
+    def get(self, user_id: str = DEFAULT_USER) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh_locked()
+            prefs = self._users.get(user_id)
+        if prefs is None:
+            return copy.deepcopy(self._defaults)
+        return copy.deepcopy(prefs)
+
+    # ── write ───────────────────────────────────────────────────────────
+
+    def save(self, prefs: Dict[str, Any], user_id: str = DEFAULT_USER) -> Dict[str, Any]:
+        with self._lock:
+            # Pick up edits made by other writers before merging ours in
+            self._refresh_locked()
+            users = dict(self._users)
+            users[user_id] = copy.deepcopy(prefs)
+            atomic_write_json({"users": users}, self._path)
+            self._users = users
+            self._signature = self._stat_signature()
+        return copy.deepcopy(prefs)
+
+    # ── internals ───────────────────────────────────────────────────────
+
+    def _stat_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _refresh_locked(self) -> None:
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return
+
+        users: Dict[str, Dict[str, Any]] = {}
+        if signature is not None:
+            try:
+                with open(self._path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as exc:
+                logger.warning("Failed to read preferences file %s: %s", self._path, exc)
+                return
+            if isinstance(data, dict) and isinstance(data.get("users"), dict):
+                users = data["users"]
+            elif isinstance(data, dict):
+                users = {DEFAULT_USER: data}
+
+        self._users = users
+        self._signature = signature
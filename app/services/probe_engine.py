@@ -0,0 +1,95 @@
+"""
+Concurrent probing engine — runs a blocking probe function over many keys
+with a bounded number of worker threads and a deadline for the whole batch.
+
+Probes are I/O bound (HTTP calls, yt-dlp subprocesses), so threads are
+enough: N slow probes cost roughly as much as the slowest one instead of
+their sum.  Keys whose probe has not finished by the deadline are left out
+of the result; their threads are abandoned, not killed, and finish on
+their own (every probe carries its own timeout).
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Hashable, Iterable, Optional, TypeVar
+
+from app.utils.config import PROBE_CONCURRENCY, PROBE_BATCH_DEADLINE
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def run_concurrently(
+    probe_fn: Callable[[K], V],
+    keys: Iterable[K],
+    max_workers: int = PROBE_CONCURRENCY,
+    deadline: Optional[float] = PROBE_BATCH_DEADLINE,
+) -> Dict[K, V]:
+    """
+    Call ``probe_fn(key)`` for every distinct key, at most ``max_workers`` at
+    a time, and return ``{key: result}`` for the probes that completed within
+    ``deadline`` seconds.  A probe that raises is logged and omitted.
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    if not unique_keys:
+        return {}
+
+    if len(unique_keys) == 1 or max_workers <= 1:
+        return _run_serially(probe_fn, unique_keys, deadline)
+
+    results: Dict[K, V] = {}
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(unique_keys)),
+        thread_name_prefix="probe",
+    )
+    try:
+        pending = {executor.submit(probe_fn, key): key for key in unique_keys}
+        while pending:
+            remaining = None if deadline is None else deadline - (time.monotonic() - started)
+            if remaining is not None and remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    results[key] = future.result()
+                except Exception as exc:
+                    logger.warning("Probe failed for %s: %s", key, exc)
+
+        if pending:
+            logger.warning(
+                "Probe batch deadline (%.1fs) reached — %d of %d probe(s) unfinished",
+                deadline,
+                len(pending),
+                len(unique_keys),
+            )
+            for future in pending:
+                future.cancel()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
+def _run_serially(
+    probe_fn: Callable[[K], V],
+    keys: Iterable[K],
+    deadline: Optional[float],
+) -> Dict[K, V]:
+    results: Dict[K, V] = {}
+    started = time.monotonic()
+    for key in keys:
+        if deadline is not None and time.monotonic() - started >= deadline:
+            logger.warning("Probe batch deadline (%.1fs) reached — skipping remaining probes", deadline)
+            break
+        try:
+            results[key] = probe_fn(key)
+        except Exception as exc:
+            logger.warning("Probe failed for %s: %s", key, exc)
+    return results
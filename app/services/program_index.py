@@ -0,0 +1,76 @@
+"""
+Program metadata index — a single pass over a generated instance that
+collects everything the pipeline needs afterwards:
+
+  * (channel_id, program_id) → url / genre / program_name
+  * (channel_id, None)       → the same, as a per-channel fallback
+  * channel_id               → channel_name
+  * score / duration aggregates used by the dynamic parameters
+"""
+
+from typing import Dict, Any, Optional, Tuple
+
+
+ProgramKey = Tuple[int, Optional[str]]
+
+
+class ProgramIndex:
+    """Read-only view over an instance keyed by (channel_id, program_id)."""
+
+    def __init__(self):
+        self._programs: Dict[ProgramKey, Dict[str, Any]] = {}
+        self._channel_names: Dict[int, str] = {}
+        self._score_sum: float = 0
+        self._program_count: int = 0
+        self._shortest_duration: Optional[int] = None
+
+    @classmethod
+    def from_instance(cls, instance: Dict[str, Any]) -> "ProgramIndex":
+        index = cls()
+        for ch in instance.get("channels", []):
+            ch_id = ch["channel_id"]
+            index._channel_names[ch_id] = ch.get("channel_name", f"Channel {ch_id}")
+            for p in ch.get("programs", []):
+                entry = {
+                    "url": p.get("url", ""),
+                    "genre": p.get("genre", ""),
+                    "program_name": p.get("program_name") or None,
+                }
+                index._programs[(ch_id, p["program_id"])] = entry
+                index._programs[(ch_id, None)] = entry   # fallback
+
+                index._score_sum += p.get("score", 0)
+                index._program_count += 1
+                if "start" in p and "end" in p:
+                    duration = p["end"] - p["start"]
+                    if index._shortest_duration is None or duration < index._shortest_duration:
+                        index._shortest_duration = duration
+        return index
+
+    # ── lookups ─────────────────────────────────────────────────────────
+
+    def get(self, channel_id: int, program_id: Optional[str]) -> Dict[str, Any]:
+        """Metadata for a program, falling back to the channel's entry."""
+        entry = self._programs.get((channel_id, program_id))
+        if entry is None:
+            entry = self._programs.get((channel_id, None), {})
+        return entry
+
+    def channel_name(self, channel_id: int) -> str:
+        return self._channel_names.get(channel_id, f"Channel {channel_id}")
+
+    # ── aggregates ──────────────────────────────────────────────────────
+
+    @property
+    def average_score(self) -> float:
+        if not self._program_count:
+            return 0
+        return self._score_sum / self._program_count
+
+    def shortest_duration(self, default: int = 0) -> int:
+        if self._shortest_duration is None:
+            return default
+        return self._shortest_duration
+
+    def __len__(self) -> int:
+        return self._program_count
@@ -8,6 +8,8 @@ import threading
 from typing import Dict, Any, Optional
 from enum import Enum
 
+from app.utils.compression import CachedBody
+
 
 class RequestStatus(str, Enum):
     PENDING = "pending"
@@ -33,6 +35,7 @@ class RequestStore:
                 "progress": 0,
                 "message": "Request received",
                 "result": None,
+                "response": None,
                 "error": None,
                 "instance": None,
                 "input_file": None,
@@ -52,9 +55,12 @@ class RequestStore:
                 self._store[request_id]["message"] = message
 
     def set_result(self, request_id: str, result: Dict[str, Any]) -> None:
+        # Serialize once, outside the lock — GET /schedule serves these bytes as-is
+        response = CachedBody({"request_id": request_id, **result})
         with self._lock:
             if request_id in self._store:
                 self._store[request_id]["result"] = result
+                self._store[request_id]["response"] = response
                 self._store[request_id]["status"] = RequestStatus.COMPLETED
                 self._store[request_id]["progress"] = 100
                 self._store[request_id]["message"] = "Schedule generated successfully"
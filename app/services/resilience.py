@@ -0,0 +1,151 @@
+"""
+Latency and failure guards for calls to external services.
+
+  * ``LatencyTracker`` keeps a rolling window of recent call latencies and
+    reports a percentile (p95 by default).
+  * ``hedged_call`` runs a call and, if it has not answered within a delay
+    (normally the tracked p95), fires one duplicate and takes whichever
+    answers first.
+  * ``CircuitBreaker`` opens after N consecutive failures; while open,
+    callers skip the service and use cached / offline data.  After a cool-down
+    one trial call is let through (half-open) and its outcome closes or
+    re-opens the breaker.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, wait, FIRST_COMPLETED
+from typing import Callable, Deque, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling window of latencies (seconds) with percentile lookup."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """``pct``-th percentile, or None until enough samples were seen."""
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a timed half-open trial."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self._name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def is_open(self) -> bool:
+        """True while calls should be skipped (a half-open trial counts as closed)."""
+        return self.state == self.OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; claims the trial slot when half-open."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+            if self._trial_in_flight:
+                return False
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = True
+            return True
+
+    def release(self) -> None:
+        """Give back a trial slot claimed by ``allow`` when no call was made."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Circuit '%s' closed — service recovered", self._name)
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(
+                        "Circuit '%s' opened after %d failure(s) — using cached data for %.0fs",
+                        self._name,
+                        self._failures,
+                        self._reset_timeout,
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+def hedged_call(
+    fn: Callable[[], T],
+    executor: Executor,
+    hedge_after: Optional[float],
+    can_hedge: Callable[[], bool] = lambda: True,
+) -> T:
+    """
+    Run ``fn`` on ``executor``; if it is still pending after ``hedge_after``
+    seconds and ``can_hedge()`` agrees, start a second ``fn`` and return the
+    first successful result.  Raises the last error if both attempts fail.
+    ``hedge_after=None`` disables hedging.
+    """
+    if hedge_after is None:
+        return fn()
+
+    primary = executor.submit(fn)
+
+    done, _ = wait([primary], timeout=hedge_after)
+    if done or not can_hedge():
+        return primary.result()
+
+    logger.debug("Hedging request still pending after %.3fs", hedge_after)
+    pending = {primary, executor.submit(fn)}
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            exc = future.exception()
+            if exc is None:
+                return future.result()
+            error = exc
+    raise error
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 from app.services.instance_generator import InstanceGenerator
+from app.services.program_index import ProgramIndex
 from app.services.request_store import store, RequestStatus
 from app.utils.file_handler import save_json, load_json, get_latest_output, get_latest_output_for_input
 from app.utils.config import (
@@ -168,7 +169,8 @@ class SchedulerService:
                 probe_streams=probe_streams,
                 discover_new_streams=discover_new_streams,
             )
-            instance = self._apply_dynamic_params(instance, scheduling_params)
+            index = ProgramIndex.from_instance(instance)
+            instance = self._apply_dynamic_params(instance, scheduling_params, index)
             store.set_instance(request_id, instance)
 
             # Step 2 — save
@@ -209,21 +211,18 @@ class SchedulerService:
                 return
 
             # Build the enriched result — attach YouTube URLs, genre, and channel names from the instance
-            url_map = self._build_url_map(instance)
-            genre_map = self._build_genre_map(instance)
-            channel_name_map = self._build_channel_name_map(instance)
-            program_name_map = self._build_program_name_map(instance)
             scheduled = output_data.get("scheduled_programs", [])
             enriched_programs: List[Dict[str, Any]] = []
             for prog in scheduled:
                 enriched = {**prog}
                 ch_id = prog.get("channel_id")
                 pid = prog.get("program_id")
-                enriched["url"] = url_map.get((ch_id, pid), url_map.get((ch_id, None), ""))
-                enriched["genre"] = genre_map.get((ch_id, pid), genre_map.get((ch_id, None), ""))
-                enriched["channel_name"] = channel_name_map.get(ch_id, f"Channel {ch_id}")
+                meta = index.get(ch_id, pid)
+                enriched["url"] = meta.get("url", "")
+                enriched["genre"] = meta.get("genre", "")
+                enriched["channel_name"] = index.channel_name(ch_id)
                 # Use actual YouTube video title from instance, fallback to cleaned program_id
-                enriched["program_name"] = program_name_map.get((ch_id, pid), program_name_map.get((ch_id, None), pid.replace("_", " ") if pid else ""))
+                enriched["program_name"] = meta.get("program_name") or (pid.replace("_", " ") if pid else "")
                 enriched_programs.append(enriched)
 
             result = {
@@ -242,58 +241,6 @@ class SchedulerService:
 
     # ── helpers ─────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _build_url_map(instance: Dict[str, Any]) -> Dict:
-        """
-        Build a map of (channel_id, program_id) → youtube_url
-        and (channel_id, None) → youtube_url  (fallback per channel).
-        """
-        url_map: Dict = {}
-        for ch in instance.get("channels", []):
-            ch_id = ch["channel_id"]
-            for p in ch.get("programs", []):
-                url_map[(ch_id, p["program_id"])] = p.get("url", "")
-                url_map[(ch_id, None)] = p.get("url", "")   # fallback
-        return url_map
-
-    @staticmethod
-    def _build_genre_map(instance: Dict[str, Any]) -> Dict:
-        """
-        Build a map of (channel_id, program_id) → genre
-        and (channel_id, None) → genre  (fallback per channel).
-        """
-        genre_map: Dict = {}
-        for ch in instance.get("channels", []):
-            ch_id = ch["channel_id"]
-            for p in ch.get("programs", []):
-                genre_map[(ch_id, p["program_id"])] = p.get("genre", "")
-                genre_map[(ch_id, None)] = p.get("genre", "")
-        return genre_map
-
-    @staticmethod
-    def _build_channel_name_map(instance: Dict[str, Any]) -> Dict:
-        """
-        Build a map of channel_id → channel_name.
-        """
-        name_map: Dict = {}
-        for ch in instance.get("channels", []):
-            name_map[ch["channel_id"]] = ch.get("channel_name", f"Channel {ch['channel_id']}")
-        return name_map
-
-    @staticmethod
-    def _build_program_name_map(instance: Dict[str, Any]) -> Dict:
-        """
-        Build a map of (channel_id, program_id) → program_name (actual YouTube video title).
-        """
-        name_map: Dict = {}
-        for ch in instance.get("channels", []):
-            ch_id = ch["channel_id"]
-            for p in ch.get("programs", []):
-                if p.get("program_name"):
-                    name_map[(ch_id, p["program_id"])] = p["program_name"]
-                    name_map[(ch_id, None)] = p["program_name"]  # fallback
-        return name_map
-
     @staticmethod
     def _extract_score(output: Dict[str, Any]) -> float:
         """Try to get total score from output; if not present, sum fitnesses."""
@@ -305,9 +252,12 @@ class SchedulerService:
         self,
         instance: Dict[str, Any],
         scheduling_params: Dict[str, Any],
+        index: Optional[ProgramIndex] = None,
     ) -> Dict[str, Any]:
-        avg_score = self._calculate_average_score(instance)
-        shortest = self._calculate_shortest_duration(instance)
+        if index is None:
+            index = ProgramIndex.from_instance(instance)
+        avg_score = index.average_score
+        shortest = index.shortest_duration(default=instance.get("min_duration", 0))
 
         min_duration_pct = scheduling_params.get("min_duration_pct")
         if min_duration_pct:
@@ -333,29 +283,6 @@ class SchedulerService:
     def _pct_of(value: float, pct: int) -> int:
         return max(0, round(value * (pct / 100.0)))
 
-    @staticmethod
-    def _calculate_average_score(instance: Dict[str, Any]) -> float:
-        scores = [
-            p.get("score", 0)
-            for ch in instance.get("channels", [])
-            for p in ch.get("programs", [])
-        ]
-        if not scores:
-            return 0
-        return sum(scores) / len(scores)
-
-    @staticmethod
-    def _calculate_shortest_duration(instance: Dict[str, Any]) -> int:
-        durations = [
-            (p.get("end", 0) - p.get("start", 0))
-            for ch in instance.get("channels", [])
-            for p in ch.get("programs", [])
-            if "start" in p and "end" in p
-        ]
-        if not durations:
-            return instance.get("min_duration", 0)
-        return min(durations)
-
     @staticmethod
     def _build_default_time_preferences(
         bonus: int,
@@ -0,0 +1,187 @@
+"""
+Background stream discovery.
+
+Once every ``DISCOVERY_INTERVAL`` seconds (24 h by default) the job scans
+every channel in ``KNOWN_CHANNELS`` for additional live streams.  Scans run
+concurrently under one global deadline, and the result replaces the
+in-memory discovered set that schedule requests read from.
+
+The last run time and the discovered streams are kept in
+``.discovery_metadata.json`` so a restarted process serves the previous
+result immediately and only re-scans once the interval has elapsed.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.instance_generator import (
+    KNOWN_CHANNELS,
+    InstanceGenerator,
+    discover_channel_live_streams,
+    get_discovered_streams,
+    set_discovered_streams,
+)
+from app.services.liveness_cache import liveness_cache
+from app.services.probe_engine import run_concurrently
+from app.utils.config import (
+    DISCOVERY_METADATA_FILE,
+    DISCOVERY_INTERVAL,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_DEADLINE,
+    DISCOVERY_CHANNEL_TIMEOUT,
+    DISCOVERY_MAX_STREAMS_PER_CHANNEL,
+)
+from app.utils.file_handler import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+
+class DiscoveryJob:
+    """Scans known channels for extra live streams on a fixed interval."""
+
+    def __init__(
+        self,
+        metadata_file: Path = DISCOVERY_METADATA_FILE,
+        interval: float = DISCOVERY_INTERVAL,
+    ):
+        self._metadata_file = Path(metadata_file)
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Optional[datetime] = None
+
+    # ── state ───────────────────────────────────────────────────────────
+
+    def load(self) -> None:
+        """Restore the previous run's time and streams from disk."""
+        last_run, streams = self._read_metadata()
+        self.last_run = last_run
+        if streams:
+            set_discovered_streams(streams)
+            logger.info("Restored %d discovered stream(s) from %s", len(streams), self._metadata_file.name)
+
+    def seconds_until_due(self) -> float:
+        if self.last_run is None:
+            return 0.0
+        elapsed = datetime.now() - self.last_run
+        return max(0.0, (timedelta(seconds=self._interval) - elapsed).total_seconds())
+
+    # ── run ─────────────────────────────────────────────────────────────
+
+    def run_once(self) -> List[Dict[str, Any]]:
+        """Scan all known channels concurrently and publish the result."""
+        started = time.monotonic()
+        logger.info("Discovering live streams from %d known channels...", len(KNOWN_CHANNELS))
+
+        scans = run_concurrently(
+            self._scan_channel,
+            list(KNOWN_CHANNELS),
+            max_workers=DISCOVERY_CONCURRENCY,
+            deadline=DISCOVERY_DEADLINE,
+        )
+
+        hardcoded = InstanceGenerator._get_all_streams()
+        seen_urls = {s["url"] for s in hardcoded}
+        discovered: List[Dict[str, Any]] = []
+        probe_results: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        # Keep KNOWN_CHANNELS order so channel ids are stable between runs
+        for channel_url, category in KNOWN_CHANNELS.items():
+            for new_stream in scans.get(channel_url) or []:
+                new_url = new_stream["url"]
+                if new_url in seen_urls:
+                    logger.debug("Skipping duplicate: %s", new_url)
+                    continue
+                discovered.append(
+                    {
+                        "channel_id": len(hardcoded) + len(discovered),
+                        "title": new_stream["title"],
+                        "url": new_url,
+                        "category": category,
+                    }
+                )
+                probe_results[new_url] = {**new_stream, "live_broadcast_content": "live"}
+                seen_urls.add(new_url)
+                logger.info("Discovered new %s stream: %s", category, new_stream["title"])
+
+        # Only replace the published set when at least one scan came back;
+        # a total outage should not wipe the previous result.
+        if scans:
+            set_discovered_streams(discovered)
+            liveness_cache.set_many(probe_results)
+        self.last_run = datetime.now()
+        self._write_metadata(get_discovered_streams())
+
+        logger.info(
+            "Discovery complete: %d stream(s) from %d/%d channel(s) in %.1fs",
+            len(discovered),
+            len(scans),
+            len(KNOWN_CHANNELS),
+            time.monotonic() - started,
+        )
+        return discovered
+
+    @staticmethod
+    def _scan_channel(channel_url: str) -> List[Dict[str, Any]]:
+        return discover_channel_live_streams(
+            channel_url,
+            max_streams=DISCOVERY_MAX_STREAMS_PER_CHANNEL,
+            timeout=DISCOVERY_CHANNEL_TIMEOUT,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.seconds_until_due())
+            try:
+                await asyncio.to_thread(self.run_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Stream discovery failed")
+                self.last_run = datetime.now()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info("Stream discovery scheduled (next run in %.0fs)", self.seconds_until_due())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ── metadata file ───────────────────────────────────────────────────
+
+    def _read_metadata(self) -> Tuple[Optional[datetime], List[Dict[str, Any]]]:
+        if not self._metadata_file.exists():
+            return None, []
+        try:
+            with open(self._metadata_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            timestamp_str = data.get("last_discovery_time")
+            last_run = datetime.fromisoformat(timestamp_str) if timestamp_str else None
+            return last_run, data.get("streams") or []
+        except Exception as e:
+            logger.warning("Could not read discovery metadata: %s", e)
+            return None, []
+
+    def _write_metadata(self, streams: List[Dict[str, Any]]) -> None:
+        try:
+            atomic_write_json(
+                {
+                    "last_discovery_time": self.last_run.isoformat(),
+                    "note": "Auto-discovery runs every 24 hours to find new live streams",
+                    "streams": streams,
+                },
+                self._metadata_file,
+            )
+        except Exception as e:
+            logger.error("Could not update discovery metadata: %s", e)
@@ -0,0 +1,84 @@
+"""
+Background liveness refresher.
+
+Started from ``create_app``; every ``LIVENESS_REFRESH_INTERVAL`` seconds it
+re-checks every hardcoded and discovered stream with bulk ``videos.list``
+calls (50 IDs per request) and writes the results into the shared liveness
+cache.  Schedule requests then find fresh entries in the cache and only
+probe inline when the snapshot has gone stale (e.g. the API was down).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, List, Optional
+
+from app.utils.config import LIVENESS_REFRESH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class StreamRefresher:
+    """Periodically refreshes liveness + metadata for all known streams."""
+
+    def __init__(
+        self,
+        urls_provider: Callable[[], List[str]],
+        refresh_fn: Callable[[List[str]], dict],
+        interval: float = LIVENESS_REFRESH_INTERVAL,
+    ):
+        self._urls_provider = urls_provider
+        self._refresh_fn = refresh_fn
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.last_refresh: Optional[float] = None
+
+    def refresh_once(self) -> int:
+        """Refresh every known stream once; returns the number of URLs checked."""
+        urls = self._urls_provider()
+        if not urls:
+            return 0
+        started = time.monotonic()
+        results = self._refresh_fn(urls)
+        self.last_refresh = time.time()
+        logger.info(
+            "Refreshed liveness for %d/%d stream(s) in %.2fs",
+            len(results),
+            len(urls),
+            time.monotonic() - started,
+        )
+        return len(urls)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Background liveness refresh failed")
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info("Background liveness refresher started (every %ss)", self._interval)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def create_refresher() -> Optional[StreamRefresher]:
+    """Build the app's refresher, or None when no YouTube API key is configured."""
+    from app.services.instance_generator import YOUTUBE_API_KEY, known_stream_urls, refresh_live_status
+
+    if not YOUTUBE_API_KEY:
+        logger.warning("YOUTUBE_API_KEY is not set — background liveness refresh disabled")
+        return None
+    return StreamRefresher(urls_provider=known_stream_urls, refresh_fn=refresh_live_status)
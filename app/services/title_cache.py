@@ -0,0 +1,197 @@
+"""
+Write-behind cache of YouTube video titles, keyed by URL.
+
+  * Reads are served from a bounded in-memory LRU.
+  * Inserts are buffered and appended to a JSON-lines log in batches — when
+    the buffer is full, on a timer, and at shutdown — instead of rewriting
+    the whole snapshot on every insert.
+  * Once the log grows past a threshold it is compacted into the snapshot
+    (``title_cache.json``) with an atomic temp-file + rename.
+
+The snapshot keeps the original ``{url: title}`` layout, so a cache built
+locally can still be shipped with the Docker image.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.utils.config import (
+    TITLE_CACHE_FILE,
+    TITLE_CACHE_LOG_FILE,
+    TITLE_CACHE_MAX_ENTRIES,
+    TITLE_CACHE_FLUSH_INTERVAL,
+    TITLE_CACHE_FLUSH_BATCH,
+    TITLE_CACHE_COMPACT_LINES,
+)
+from app.utils.file_handler import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+
+class TitleCache:
+    """Bounded LRU over an append-only log + compacted JSON snapshot."""
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        log_path: Path,
+        max_entries: int = TITLE_CACHE_MAX_ENTRIES,
+        flush_interval: float = TITLE_CACHE_FLUSH_INTERVAL,
+        flush_batch: int = TITLE_CACHE_FLUSH_BATCH,
+        compact_lines: int = TITLE_CACHE_COMPACT_LINES,
+    ):
+        self._snapshot_path = Path(snapshot_path)
+        self._log_path = Path(log_path)
+        self._max_entries = max(1, max_entries)
+        self._flush_interval = flush_interval
+        self._flush_batch = max(1, flush_batch)
+        self._compact_lines = max(1, compact_lines)
+
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._pending: List[Tuple[str, str]] = []
+        self._log_lines = 0
+        self._timer: Optional[threading.Timer] = None
+
+    # ── read ────────────────────────────────────────────────────────────
+
+    def get(self, url: str) -> Optional[str]:
+        with self._lock:
+            title = self._entries.get(url)
+            if title is not None:
+                self._entries.move_to_end(url)
+            return title
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # ── write ───────────────────────────────────────────────────────────
+
+    def put(self, url: str, title: str) -> None:
+        if not url or not title:
+            return
+        with self._lock:
+            if self._entries.get(url) == title:
+                self._entries.move_to_end(url)
+                return
+            self._remember(url, title)
+            self._pending.append((url, title))
+            if len(self._pending) >= self._flush_batch:
+                self.flush()
+            else:
+                self._schedule_flush()
+
+    def flush(self) -> None:
+        """Append buffered inserts to the log; compact when it is large."""
+        with self._lock:
+            self._cancel_timer()
+            if self._pending:
+                pending, self._pending = self._pending, []
+                try:
+                    with open(self._log_path, "a", encoding="utf-8") as f:
+                        f.write("".join(
+                            json.dumps([url, title], ensure_ascii=False) + "\n"
+                            for url, title in pending
+                        ))
+                    self._log_lines += len(pending)
+                except OSError as exc:
+                    logger.warning("Failed to append to title cache log: %s", exc)
+                    self._pending = pending + self._pending
+                    return
+            if self._log_lines >= self._compact_lines:
+                self.compact()
+
+    def compact(self) -> None:
+        """Fold the log into the snapshot atomically and truncate the log."""
+        with self._lock:
+            merged = self._read_snapshot()
+            merged.update(self._read_log())
+            try:
+                atomic_write_json(merged, self._snapshot_path)
+                if self._log_path.exists():
+                    os.unlink(self._log_path)
+                self._log_lines = 0
+                logger.info("Compacted title cache (%d titles)", len(merged))
+            except OSError as exc:
+                logger.warning("Failed to compact title cache: %s", exc)
+
+    def close(self) -> None:
+        """Flush everything and compact; registered to run at interpreter exit."""
+        with self._lock:
+            self.flush()
+            if self._log_lines:
+                self.compact()
+
+    # ── load ────────────────────────────────────────────────────────────
+
+    def load(self) -> None:
+        with self._lock:
+            snapshot = self._read_snapshot()
+            log_entries = self._read_log()
+            self._log_lines = len(log_entries)
+            self._entries.clear()
+            for url, title in snapshot.items():
+                self._remember(url, title)
+            for url, title in log_entries.items():
+                self._remember(url, title)
+        logger.info("Loaded %d cached titles", len(self._entries))
+
+    # ── internals ───────────────────────────────────────────────────────
+
+    def _remember(self, url: str, title: str) -> None:
+        self._entries[url] = title
+        self._entries.move_to_end(url)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_snapshot(self) -> Dict[str, str]:
+        if not self._snapshot_path.exists():
+            return {}
+        try:
+            with open(self._snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Failed to load title cache: %s", exc)
+            return {}
+
+    def _read_log(self) -> Dict[str, str]:
+        entries: Dict[str, str] = {}
+        if not self._log_path.exists():
+            return entries
+        try:
+            with open(self._log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        url, title = json.loads(line)
+                    except (ValueError, TypeError):
+                        continue  # torn trailing line from a crash
+                    entries[url] = title
+        except OSError as exc:
+            logger.warning("Failed to read title cache log: %s", exc)
+        return entries
+
+    def _schedule_flush(self) -> None:
+        if self._timer is None and self._flush_interval > 0:
+            self._timer = threading.Timer(self._flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            if self._timer is not threading.current_thread():
+                self._timer.cancel()
+            self._timer = None
+
+
+# Singleton used across the app
+title_cache = TitleCache(TITLE_CACHE_FILE, TITLE_CACHE_LOG_FILE)
+title_cache.load()
+atexit.register(title_cache.close)
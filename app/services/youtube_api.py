@@ -0,0 +1,291 @@
+"""
+Quota-aware access to the YouTube Data API v3.
+
+Every Data API call goes through ``api_get``, which
+
+  * waits for a token from a process-wide token bucket (``YOUTUBE_API_RATE``
+    requests per second, bursts up to ``YOUTUBE_API_BURST``), and
+  * charges the call's quota cost (``videos.list`` = 1 unit, ``search.list``
+    = 100 units) to a per-day ledger and refuses calls the day's budget
+    cannot cover.
+
+The ledger follows the API's quota day (midnight Pacific time) and is
+persisted to ``youtube_quota.json`` so a restart does not forget what was
+already spent.  Once the remaining budget drops below
+``YOUTUBE_QUOTA_RESERVE``, ``low_budget()`` turns True and callers fall back
+to cached (even stale) results before spending more.
+
+Calls are also latency-budgeted (see resilience.py): a cheap call still
+pending after the endpoint's observed p95 latency is hedged with a
+duplicate, and a circuit breaker opens after repeated failures so callers
+switch to cached / offline metadata instead of waiting on a degraded API.
+"""
+
+import atexit
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.services.http_client import get_json
+from app.services.liveness_cache import LivenessCache
+from app.services.resilience import CircuitBreaker, LatencyTracker, hedged_call
+from app.utils.config import (
+    YOUTUBE_API_RATE,
+    YOUTUBE_API_BURST,
+    YOUTUBE_QUOTA_DAILY_LIMIT,
+    YOUTUBE_QUOTA_RESERVE,
+    YOUTUBE_QUOTA_FILE,
+    CHANNEL_SEARCH_CACHE_FILE,
+    CHANNEL_SEARCH_TTL,
+    YOUTUBE_HEDGE_ENABLED,
+    YOUTUBE_HEDGE_PERCENTILE,
+    YOUTUBE_HEDGE_MIN_SAMPLES,
+    YOUTUBE_HEDGE_MIN_DELAY,
+    YOUTUBE_HEDGE_MAX_COST,
+    YOUTUBE_BREAKER_FAILURES,
+    YOUTUBE_BREAKER_RESET,
+)
+from app.utils.file_handler import atomic_write_json
+
+try:
+    from zoneinfo import ZoneInfo
+    _QUOTA_TZ = ZoneInfo("America/Los_Angeles")
+except Exception:  # no tz database available
+    _QUOTA_TZ = timezone.utc
+
+logger = logging.getLogger(__name__)
+
+# Quota cost per endpoint (units)
+COST_VIDEOS_LIST = 1
+COST_SEARCH_LIST = 100
+
+
+class ApiUnavailable(Exception):
+    """The call was not issued (budget, rate limit or open circuit)."""
+
+
+class QuotaExceeded(ApiUnavailable):
+    """The call would exceed today's quota budget."""
+
+
+class RateLimited(ApiUnavailable):
+    """No rate-limit token became available within the call's timeout."""
+
+
+class CircuitOpen(ApiUnavailable):
+    """The API failed repeatedly and is being bypassed for a while."""
+
+
+class TokenBucket:
+    """Classic token bucket; ``acquire`` blocks until a token is available."""
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = max(rate, 1e-6)
+        self._capacity = max(1, capacity)
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self._rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class QuotaLedger:
+    """Units spent on the current quota day, persisted across restarts."""
+
+    def __init__(self, path: Optional[Path], daily_limit: int, save_interval: float = 5):
+        self._path = Path(path) if path else None
+        self._daily_limit = daily_limit
+        self._save_interval = save_interval
+        self._lock = threading.Lock()
+        self._day = self._today()
+        self._used = 0
+        self._timer: Optional[threading.Timer] = None
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(_QUOTA_TZ).date().isoformat()
+
+    def _roll_locked(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day, self._used = today, 0
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            self._roll_locked()
+            return max(0, self._daily_limit - self._used)
+
+    def charge(self, units: int) -> bool:
+        """Reserve ``units``; False (nothing charged) if the budget can't cover them."""
+        with self._lock:
+            self._roll_locked()
+            if self._used + units > self._daily_limit:
+                return False
+            self._used += units
+            self._schedule_save()
+            return True
+
+    def mark_exhausted(self) -> None:
+        """The API itself reported quotaExceeded — stop spending until tomorrow."""
+        with self._lock:
+            self._roll_locked()
+            self._used = max(self._used, self._daily_limit)
+            self._schedule_save()
+
+    # ── persistence ─────────────────────────────────────────────────────
+
+    def load(self) -> None:
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Failed to load YouTube quota ledger: %s", exc)
+            return
+        with self._lock:
+            if data.get("day") == self._today():
+                self._day = data["day"]
+                self._used = max(self._used, int(data.get("used", 0)))
+
+    def save(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                if self._timer is not threading.current_thread():
+                    self._timer.cancel()
+                self._timer = None
+            if self._path is None:
+                return
+            data = {"day": self._day, "used": self._used, "limit": self._daily_limit}
+        try:
+            atomic_write_json(data, self._path)
+        except OSError as exc:
+            logger.warning("Failed to save YouTube quota ledger: %s", exc)
+
+    def _schedule_save(self) -> None:
+        if self._path is not None and self._timer is None:
+            self._timer = threading.Timer(self._save_interval, self.save)
+            self._timer.daemon = True
+            self._timer.start()
+
+
+# Singletons used across the app
+rate_limiter = TokenBucket(YOUTUBE_API_RATE, YOUTUBE_API_BURST)
+quota_ledger = QuotaLedger(YOUTUBE_QUOTA_FILE, YOUTUBE_QUOTA_DAILY_LIMIT)
+quota_ledger.load()
+atexit.register(quota_ledger.save)
+
+# channel id -> {"video_id": ...} or None (channel has no live stream)
+search_cache = LivenessCache(CHANNEL_SEARCH_CACHE_FILE, ttl=CHANNEL_SEARCH_TTL, negative_ttl=CHANNEL_SEARCH_TTL)
+search_cache.load()
+atexit.register(search_cache.save)
+
+
+breaker = CircuitBreaker("youtube-api", YOUTUBE_BREAKER_FAILURES, YOUTUBE_BREAKER_RESET)
+_latency: Dict[str, LatencyTracker] = {}
+_hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yt-api")
+
+
+def low_budget() -> bool:
+    """True once the remaining daily quota drops below the configured reserve."""
+    return quota_ledger.remaining < YOUTUBE_QUOTA_RESERVE
+
+
+def degraded() -> bool:
+    """True while the circuit breaker is open — callers should use cached data."""
+    return breaker.is_open()
+
+
+def api_get(
+    url: str,
+    params: Dict[str, Any],
+    cost: int,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Rate-limited, quota-charged, hedged GET against the Data API.
+
+    Raises ``RateLimited``, ``QuotaExceeded`` or ``CircuitOpen`` instead of
+    issuing the call; otherwise behaves like ``http_client.get_json``.
+    Transport errors and 5xx answers count as breaker failures.
+    """
+    if not breaker.allow():
+        raise CircuitOpen("YouTube API circuit is open")
+    if not rate_limiter.acquire(timeout=timeout):
+        breaker.release()
+        raise RateLimited(f"no YouTube API rate-limit token within {timeout}s")
+    if not quota_ledger.charge(cost):
+        breaker.release()
+        raise QuotaExceeded(
+            f"YouTube API quota exhausted ({quota_ledger.remaining} unit(s) left, call costs {cost})"
+        )
+
+    tracker = _latency.setdefault(url, LatencyTracker(min_samples=YOUTUBE_HEDGE_MIN_SAMPLES))
+
+    def attempt() -> Dict[str, Any]:
+        started = time.monotonic()
+        result = get_json(url, params=params, timeout=timeout)
+        if not _server_error(result):
+            tracker.record(time.monotonic() - started)
+        return result
+
+    def can_hedge() -> bool:
+        # A duplicate costs quota and a rate-limit token like any other call
+        return rate_limiter.acquire(timeout=0) and quota_ledger.charge(cost)
+
+    hedge_after = None
+    if YOUTUBE_HEDGE_ENABLED and cost <= YOUTUBE_HEDGE_MAX_COST:
+        p = tracker.percentile(YOUTUBE_HEDGE_PERCENTILE)
+        if p is not None:
+            hedge_after = max(p, YOUTUBE_HEDGE_MIN_DELAY)
+
+    try:
+        data = hedged_call(attempt, _hedge_executor, hedge_after, can_hedge)
+    except Exception:
+        breaker.record_failure()
+        raise
+
+    if _server_error(data):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+    error = data.get("error") if isinstance(data, dict) else None
+    if error:
+        reasons = {e.get("reason") for e in error.get("errors", []) if isinstance(e, dict)}
+        if reasons & {"quotaExceeded", "dailyLimitExceeded"}:
+            logger.error("YouTube API reports the daily quota as exhausted")
+            quota_ledger.mark_exhausted()
+    return data
+
+
+def _server_error(data: Any) -> bool:
+    error = data.get("error") if isinstance(data, dict) else None
+    if not isinstance(error, dict):
+        return False
+    try:
+        return int(error.get("code", 0)) >= 500
+    except (TypeError, ValueError):
+        return False
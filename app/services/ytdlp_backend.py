@@ -0,0 +1,179 @@
+"""
+In-process yt-dlp backend.
+
+Keeps a small pool of long-lived ``yt_dlp.YoutubeDL`` instances so the
+import and extractor registry setup are paid once per process instead of
+once per probe (``python -m yt_dlp`` costs seconds before any network I/O).
+
+Extractions run on a dedicated thread pool; each call gets ``timeout``
+seconds counted from when a worker picks it up, so time spent queued
+behind other extractions does not eat into it.  On timeout the call is
+cancelled: a running playlist extraction stops at the next entry.  A
+single-video extraction that is already on the wire is bounded by
+``YTDLP_SOCKET_TIMEOUT`` and returns its instance to the pool when it
+finishes.
+
+``yt_dlp`` is optional at import time — when it is missing, ``available()``
+is False and callers fall back to the subprocess path.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Dict, List, Optional
+
+from app.utils.config import YTDLP_POOL_SIZE, YTDLP_SOCKET_TIMEOUT
+
+try:
+    import yt_dlp
+    from yt_dlp.utils import DownloadCancelled
+except ImportError:  # pragma: no cover - depends on the environment
+    yt_dlp = None
+    DownloadCancelled = Exception
+
+logger = logging.getLogger(__name__)
+
+_BASE_OPTIONS: Dict[str, Any] = {
+    "quiet": True,
+    "no_warnings": True,
+    "noprogress": True,
+    "skip_download": True,
+    "socket_timeout": YTDLP_SOCKET_TIMEOUT,
+}
+
+
+class ExtractionTimeout(Exception):
+    """The extraction did not finish within its timeout."""
+
+
+class YtDlpPool:
+    """Bounded pool of warm ``YoutubeDL`` instances plus the threads that drive them."""
+
+    def __init__(self, size: int = YTDLP_POOL_SIZE):
+        self._size = max(1, size)
+        self._lock = threading.Lock()
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        self._created = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ── public API ──────────────────────────────────────────────────────
+
+    def extract(
+        self,
+        url: str,
+        timeout: float,
+        playlist_end: Optional[int] = None,
+        live_only: bool = False,
+        queue_timeout: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run ``extract_info(url, download=False)`` on a pooled instance.
+
+        ``playlist_end`` switches from single-video to playlist mode and caps
+        the number of entries resolved; ``live_only`` skips entries that are
+        not currently live.  Raises ``ExtractionTimeout`` when the extraction
+        runs longer than ``timeout`` seconds, or waits longer than
+        ``queue_timeout`` seconds for a free worker (default: as long as it
+        takes; every running extraction is itself bounded), and lets yt-dlp's
+        own errors propagate.
+        """
+        cancelled = threading.Event()
+        started = threading.Event()
+        started_at: List[float] = []
+        future = self._get_executor().submit(
+            self._extract, url, playlist_end, live_only, cancelled, started, started_at
+        )
+        # Also wake up if the task is cancelled before a worker picks it up
+        future.add_done_callback(lambda _: started.set())
+        try:
+            if not started.wait(queue_timeout):
+                raise FutureTimeout()
+            remaining = started_at[0] + timeout - time.monotonic() if started_at else 0
+            return future.result(timeout=max(0.0, remaining))
+        except FutureTimeout:
+            cancelled.set()
+            future.cancel()
+            raise ExtractionTimeout(f"yt-dlp extraction exceeded {timeout}s for {url}")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ── internals ───────────────────────────────────────────────────────
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._size, thread_name_prefix="yt-dlp"
+                )
+            return self._executor
+
+    def _acquire(self) -> Any:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self._size:
+                self._created += 1
+                return yt_dlp.YoutubeDL(dict(_BASE_OPTIONS))
+        return self._idle.get()
+
+    def _extract(
+        self,
+        url: str,
+        playlist_end: Optional[int],
+        live_only: bool,
+        cancelled: threading.Event,
+        started: threading.Event,
+        started_at: List[float],
+    ) -> Optional[Dict[str, Any]]:
+        if cancelled.is_set():
+            return None
+        started_at.append(time.monotonic())
+        started.set()
+
+        def match_filter(info: Dict[str, Any], incomplete: bool = False) -> Optional[str]:
+            if cancelled.is_set():
+                raise DownloadCancelled("extraction cancelled")
+            if live_only and not incomplete and not info.get("is_live"):
+                return "not live"
+            return None
+
+        ydl = self._acquire()
+        try:
+            # Each instance is used by one thread at a time, so per-call
+            # options can be set directly on its params.
+            ydl.params["noplaylist"] = playlist_end is None
+            ydl.params["playlistend"] = playlist_end
+            ydl.params["match_filter"] = match_filter
+            return ydl.sanitize_info(ydl.extract_info(url, download=False))
+        finally:
+            self._idle.put(ydl)
+
+
+_pool = YtDlpPool()
+
+
+def available() -> bool:
+    """True when yt_dlp can be imported in this process."""
+    return yt_dlp is not None
+
+
+def extract_info(
+    url: str,
+    timeout: float,
+    playlist_end: Optional[int] = None,
+    live_only: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """Extract metadata for ``url`` in-process (see ``YtDlpPool.extract``)."""
+    return _pool.extract(url, timeout, playlist_end=playlist_end, live_only=live_only)
+
+
+def shutdown() -> None:
+    _pool.shutdown()
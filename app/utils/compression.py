@@ -0,0 +1,111 @@
+"""
+Response body helpers — pre-serialized JSON bodies with lazily computed
+gzip / brotli variants, each with its own strong ETag.
+
+brotli is optional: when the package is not installed only gzip is offered.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+from app.utils.config import RESPONSE_GZIP_LEVEL, RESPONSE_BROTLI_QUALITY
+
+IDENTITY = "identity"
+GZIP = "gzip"
+BROTLI = "br"
+
+
+def supported_encodings() -> tuple:
+    """Encodings this process can produce, in order of preference."""
+    if brotli is not None:
+        return (BROTLI, GZIP)
+    return (GZIP,)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> str:
+    """
+    Pick the best content-coding for an Accept-Encoding header.
+    Codings with q=0 are treated as refused.
+    """
+    if not accept_encoding:
+        return IDENTITY
+
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+
+    for encoding in supported_encodings():
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > 0:
+            return encoding
+    return IDENTITY
+
+
+def _opaque_tag(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against an ETag.  If-None-Match uses
+    weak comparison (RFC 9110 §13.1.2), so ``W/`` prefixes are ignored.
+    """
+    if not if_none_match:
+        return False
+    candidates = [_opaque_tag(c) for c in if_none_match.split(",")]
+    return "*" in candidates or _opaque_tag(etag) in candidates
+
+
+class CachedBody:
+    """
+    A JSON document serialized once.  Compressed variants are produced on
+    first request and kept.  Each encoding has its own strong ETag derived
+    from the body's hash, since a strong validator must change whenever
+    the bytes sent change, Content-Encoding included.
+    """
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.body: bytes = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.digest: str = hashlib.sha256(self.body).hexdigest()[:32]
+        self._encoded: Dict[str, bytes] = {IDENTITY: self.body}
+        self._lock = threading.Lock()
+
+    def etag(self, encoding: str = IDENTITY) -> str:
+        """Strong ETag of the body sent with ``encoding``."""
+        if encoding == IDENTITY:
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def encoded(self, encoding: str) -> bytes:
+        with self._lock:
+            if encoding not in self._encoded:
+                self._encoded[encoding] = self._compress(encoding)
+            return self._encoded[encoding]
+
+    def _compress(self, encoding: str) -> bytes:
+        if encoding == GZIP:
+            # mtime=0 keeps the gzip bytes stable for a given body
+            return gzip.compress(self.body, compresslevel=RESPONSE_GZIP_LEVEL, mtime=0)
+        if encoding == BROTLI and brotli is not None:
+            return brotli.compress(self.body, quality=RESPONSE_BROTLI_QUALITY)
+        raise ValueError(f"Unsupported content encoding: {encoding}")
@@ -10,6 +10,7 @@ BASE_DIR = Path(__file__).parent.parent.parent
 ALGORITHM_DIR = BASE_DIR / "app" / "algorithm" / "AA_25-26"
 DATA_INPUT_DIR = ALGORITHM_DIR / "data" / "input"
 DATA_OUTPUT_DIR = ALGORITHM_DIR / "data" / "output"
+CACHE_DIR = Path(os.getenv("CACHE_DIR", str(BASE_DIR)))  # persisted caches / ledgers
 
 # Create directories if they don't exist
 DATA_INPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -20,6 +21,81 @@ API_TITLE = "TV Scheduling API"
 API_VERSION = "1.0.0"
 API_DESCRIPTION = "API for TV Schedule Optimization using Beam Search Algorithm"
 
+# Response compression
+RESPONSE_GZIP_MIN_SIZE = int(os.getenv("RESPONSE_GZIP_MIN_SIZE", "1024"))  # bytes
+RESPONSE_GZIP_LEVEL = 6
+RESPONSE_BROTLI_QUALITY = 5
+
+# Stream probing
+PROBE_CONCURRENCY = int(os.getenv("PROBE_CONCURRENCY", "8"))  # parallel probes per batch
+PROBE_BATCH_DEADLINE = float(os.getenv("PROBE_BATCH_DEADLINE", "20"))  # seconds for a whole batch
+
+# External endpoints (overridable, e.g. to point at benchmarks/youtube_stub.py)
+YOUTUBE_API_BASE_URL = os.getenv("YOUTUBE_API_BASE_URL", "https://www.googleapis.com/youtube/v3").rstrip("/")
+YOUTUBE_OEMBED_URL = os.getenv("YOUTUBE_OEMBED_URL", "https://www.youtube.com/oembed")
+
+# yt-dlp fallback: "inprocess" (warm YoutubeDL pool) or "subprocess" (python -m yt_dlp)
+YTDLP_BACKEND = os.getenv("YTDLP_BACKEND", "inprocess").lower()
+YTDLP_COMMAND = os.getenv("YTDLP_COMMAND", "python -m yt_dlp")  # subprocess backend invocation
+YTDLP_POOL_SIZE = int(os.getenv("YTDLP_POOL_SIZE", "4"))  # warm YoutubeDL instances / threads
+YTDLP_SOCKET_TIMEOUT = 10  # seconds
+
+# Shared HTTP client for YouTube Data API / oEmbed calls
+YOUTUBE_HTTP_MAX_CONNECTIONS = int(os.getenv("YOUTUBE_HTTP_MAX_CONNECTIONS", "20"))
+YOUTUBE_HTTP_MAX_KEEPALIVE = int(os.getenv("YOUTUBE_HTTP_MAX_KEEPALIVE", "10"))
+YOUTUBE_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("YOUTUBE_HTTP_KEEPALIVE_EXPIRY", "30"))  # seconds
+YOUTUBE_HTTP_TIMEOUT = float(os.getenv("YOUTUBE_HTTP_TIMEOUT", "8"))  # seconds
+YOUTUBE_HTTP_CONNECT_TIMEOUT = float(os.getenv("YOUTUBE_HTTP_CONNECT_TIMEOUT", "3"))  # seconds
+YOUTUBE_HTTP2 = os.getenv("YOUTUBE_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# YouTube Data API budgeting (default project quota is 10,000 units/day)
+YOUTUBE_API_RATE = float(os.getenv("YOUTUBE_API_RATE", "5"))  # requests per second
+YOUTUBE_API_BURST = int(os.getenv("YOUTUBE_API_BURST", "10"))
+YOUTUBE_QUOTA_DAILY_LIMIT = int(os.getenv("YOUTUBE_QUOTA_DAILY_LIMIT", "10000"))  # units
+YOUTUBE_QUOTA_RESERVE = int(os.getenv("YOUTUBE_QUOTA_RESERVE", "1000"))  # below this, prefer cached results
+YOUTUBE_QUOTA_FILE = CACHE_DIR / "youtube_quota.json"
+CHANNEL_SEARCH_CACHE_FILE = CACHE_DIR / "channel_search_cache.json"
+CHANNEL_SEARCH_TTL = float(os.getenv("CHANNEL_SEARCH_TTL", "900"))  # seconds a search.list answer stays fresh
+YOUTUBE_HEDGE_ENABLED = os.getenv("YOUTUBE_HEDGE_ENABLED", "true").lower() in ("1", "true", "yes")
+YOUTUBE_HEDGE_PERCENTILE = 95  # hedge a call still pending after this latency percentile
+YOUTUBE_HEDGE_MIN_SAMPLES = 20  # latencies observed before hedging kicks in
+YOUTUBE_HEDGE_MIN_DELAY = 0.05  # seconds
+YOUTUBE_HEDGE_MAX_COST = 1  # only hedge cheap calls (videos.list), never search.list
+YOUTUBE_BREAKER_FAILURES = int(os.getenv("YOUTUBE_BREAKER_FAILURES", "5"))  # consecutive failures to open
+YOUTUBE_BREAKER_RESET = float(os.getenv("YOUTUBE_BREAKER_RESET", "60"))  # seconds before a trial call
+
+# Title cache (write-behind)
+TITLE_CACHE_FILE = CACHE_DIR / "title_cache.json"      # compacted snapshot
+TITLE_CACHE_LOG_FILE = CACHE_DIR / "title_cache.log"   # append-only insert log
+TITLE_CACHE_MAX_ENTRIES = int(os.getenv("TITLE_CACHE_MAX_ENTRIES", "5000"))  # in-memory bound
+TITLE_CACHE_FLUSH_INTERVAL = float(os.getenv("TITLE_CACHE_FLUSH_INTERVAL", "5"))  # seconds
+TITLE_CACHE_FLUSH_BATCH = 100  # buffered inserts that force a flush
+TITLE_CACHE_COMPACT_LINES = 500  # log lines that trigger compaction
+TITLE_NEGATIVE_TTL = float(os.getenv("TITLE_NEGATIVE_TTL", "600"))  # seconds a failed lookup is not retried
+TITLE_RESOLVE_CONCURRENCY = 8  # parallel oEmbed fetches per batch
+TITLE_RESOLVE_DEADLINE = 5  # seconds for a whole batch
+
+# Stream liveness cache (shared across requests, persisted across restarts)
+LIVENESS_CACHE_FILE = CACHE_DIR / "liveness_cache.json"
+LIVENESS_TTL = float(os.getenv("LIVENESS_TTL", "300"))  # seconds a live/offline result stays fresh
+LIVENESS_NEGATIVE_TTL = float(os.getenv("LIVENESS_NEGATIVE_TTL", "1800"))  # dead / unresolvable URLs
+LIVENESS_CACHE_MAX_AGE = 7 * 24 * 3600  # stale entries kept as an offline fallback
+LIVENESS_CACHE_SAVE_INTERVAL = 10  # seconds between a change and the write to disk
+LIVENESS_REFRESH_ENABLED = os.getenv("LIVENESS_REFRESH_ENABLED", "true").lower() in ("1", "true", "yes")
+LIVENESS_REFRESH_INTERVAL = float(os.getenv("LIVENESS_REFRESH_INTERVAL", "120"))  # keep below LIVENESS_TTL
+
+# Background stream discovery
+DISCOVERY_ENABLED = os.getenv("DISCOVERY_ENABLED", "true").lower() in ("1", "true", "yes")
+DISCOVERY_METADATA_FILE = BASE_DIR / "app" / ".discovery_metadata.json"
+DISCOVERY_INTERVAL = float(os.getenv("DISCOVERY_INTERVAL", str(24 * 3600)))  # seconds between runs
+DISCOVERY_CONCURRENCY = int(os.getenv("DISCOVERY_CONCURRENCY", "4"))  # parallel channel scans
+DISCOVERY_DEADLINE = float(os.getenv("DISCOVERY_DEADLINE", "60"))  # seconds for a whole run
+DISCOVERY_CHANNEL_TIMEOUT = 15  # seconds per channel scan
+DISCOVERY_MAX_STREAMS_PER_CHANNEL = 3
+
+# Generated channel timetables (LRU-cached, seeded per stream/window/day)
+TIMETABLE_CACHE_SIZE = int(os.getenv("TIMETABLE_CACHE_SIZE", "1024"))
+
 # Algorithm Configuration
 ALGORITHM_SCRIPT = ALGORITHM_DIR / "main.py"
 MAX_EXECUTION_TIME = 300  # seconds
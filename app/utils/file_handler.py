@@ -3,9 +3,11 @@ File handling utilities for JSON I/O operations
 """
 
 import json
+import os
+import tempfile
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 def save_json(data: Dict[str, Any], directory: Path, filename: str = None) -> Path:
@@ -27,6 +29,29 @@ def save_json(data: Dict[str, Any], directory: Path, filename: str = None) -> Pa
     return filepath
 
 
+def atomic_write_json(data: Any, filepath: Path, indent: Optional[int] = 2) -> Path:
+    """
+    Write JSON to a temp file in the target directory, then rename it over
+    the destination so readers never observe a partially written file.
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return filepath
+
+
 def load_json(filepath: Path) -> Dict[str, Any]:
     """Load JSON file to dictionary"""
     with open(filepath, 'r') as f:
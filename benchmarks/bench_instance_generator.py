@@ -0,0 +1,135 @@
+"""
+Load test for InstanceGenerator.generate_instance against the local YouTube stub.
+
+For each size it builds that many synthetic streams, runs one cold
+``generate_instance`` (empty caches) and one warm run (same streams), and
+reports wall-clock latency plus the number of calls per stub endpoint and
+yt-dlp fallbacks.  No network access is needed: API, oEmbed and yt-dlp all
+point at benchmarks/youtube_stub.py, and caches live in a temp directory.
+
+    python benchmarks/bench_instance_generator.py
+    python benchmarks/bench_instance_generator.py --sizes 10 100 --latency-ms 120 --error-rate 0.05
+"""
+
+import argparse
+import os
+import shlex
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+
+from youtube_stub import StubConfig, YouTubeStub, video_id_for  # noqa: E402
+
+CATEGORIES = ("technology", "science", "climate", "others")
+
+
+def _configure_environment(stub: YouTubeStub, ytdlp_latency_ms: float) -> None:
+    # Must run before anything under app/ is imported: config is read at import time
+    os.environ["YOUTUBE_API_BASE_URL"] = f"{stub.base_url}/youtube/v3"
+    os.environ["YOUTUBE_OEMBED_URL"] = f"{stub.base_url}/oembed"
+    os.environ["YOUTUBE_API_KEY"] = "stub-key"
+    os.environ["YTDLP_BACKEND"] = "subprocess"
+    os.environ["YTDLP_COMMAND"] = " ".join(
+        shlex.quote(part)
+        for part in (sys.executable, str(HERE / "youtube_stub.py"), "ytdlp", "--latency-ms", str(ytdlp_latency_ms))
+    )
+    os.environ["CACHE_DIR"] = tempfile.mkdtemp(prefix="tv-bench-")
+    os.environ.setdefault("YOUTUBE_QUOTA_DAILY_LIMIT", "1000000")
+
+
+def _synthetic_streams(size: int, offset: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "channel_id": i,
+            "title": f"Bench stream {i}",
+            "url": f"https://www.youtube.com/watch?v={video_id_for(offset + i)}",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+        }
+        for i in range(size)
+    ]
+
+
+def _run_once(generator, params: Dict[str, Any], stub: YouTubeStub, ig_module) -> Dict[str, Any]:
+    stub.reset_counts()
+    ytdlp_calls = 0
+    probe = ig_module.probe_youtube_stream
+
+    def counting_probe(*args, **kwargs):
+        nonlocal ytdlp_calls
+        ytdlp_calls += 1
+        return probe(*args, **kwargs)
+
+    ig_module.probe_youtube_stream = counting_probe
+    try:
+        started = time.perf_counter()
+        instance = generator.generate_instance(params, probe_streams=True, discover_new_streams=False)
+        elapsed = time.perf_counter() - started
+    finally:
+        ig_module.probe_youtube_stream = probe
+
+    return {
+        "latency": elapsed,
+        "channels": len(instance["channels"]),
+        "programs": sum(len(c["programs"]) for c in instance["channels"]),
+        "calls": dict(stub.calls),
+        "fallbacks": ytdlp_calls,
+    }
+
+
+def _format_row(size: int, phase: str, result: Dict[str, Any]) -> str:
+    calls = result["calls"]
+    return (
+        f"{size:>6} {phase:<5} {result['latency'] * 1000:>10.1f} "
+        f"{calls.get('videos.list', 0):>7} {calls.get('search.list', 0):>7} "
+        f"{calls.get('oembed', 0):>7} {result['fallbacks']:>7} "
+        f"{result['channels']:>8} {result['programs']:>8}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="mean stub API latency")
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stub requests answered with 503")
+    parser.add_argument("--offline-rate", type=float, default=0.1, help="fraction of streams reported as not live")
+    parser.add_argument("--ytdlp-latency-ms", type=float, default=300.0)
+    args = parser.parse_args()
+
+    config = StubConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.offline_rate)
+    with YouTubeStub(config) as stub:
+        _configure_environment(stub, args.ytdlp_latency_ms)
+
+        import logging
+        logging.basicConfig(level=logging.ERROR)
+        from app.services import instance_generator as ig_module
+
+        print(f"stub at {stub.base_url}, latency {args.latency_ms}±{args.jitter_ms} ms, "
+              f"error rate {args.error_rate:.0%}, offline rate {args.offline_rate:.0%}")
+        print(f"{'size':>6} {'run':<5} {'latency ms':>10} {'videos':>7} {'search':>7} "
+              f"{'oembed':>7} {'yt-dlp':>7} {'channels':>8} {'programs':>8}")
+
+        offset = 0
+        for size in args.sizes:
+            generator = ig_module.InstanceGenerator()
+            generator.streams = _synthetic_streams(size, offset)
+            offset += size
+            params = {
+                "opening_time": 480,
+                "closing_time": 1380,
+                "min_duration": 30,
+                "channels_count": size,
+            }
+            for phase in ("cold", "warm"):
+                result = _run_once(generator, params, stub, ig_module)
+                print(_format_row(size, phase, result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
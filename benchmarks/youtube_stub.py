@@ -0,0 +1,242 @@
+"""
+Local stand-in for the YouTube endpoints used by InstanceGenerator.
+
+Emulates, over plain HTTP on localhost:
+
+  GET /youtube/v3/videos   videos.list (snippet,liveStreamingDetails)
+  GET /youtube/v3/search   search.list (eventType=live)
+  GET /oembed              oEmbed title lookup
+
+with configurable per-request latency and error rate, and counts requests
+per endpoint.  Responses are derived from a hash of the video / channel ID,
+so the same ID always gets the same answer.
+
+Point the app at it with:
+
+  YOUTUBE_API_BASE_URL=http://127.0.0.1:8765/youtube/v3
+  YOUTUBE_OEMBED_URL=http://127.0.0.1:8765/oembed
+  YTDLP_BACKEND=subprocess
+  YTDLP_COMMAND="python benchmarks/youtube_stub.py ytdlp"
+
+Run standalone:   python benchmarks/youtube_stub.py serve --port 8765
+The ``ytdlp`` sub-command mimics ``yt-dlp --dump-json`` for one URL.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+CHANNEL_COUNT = 50  # stub videos are spread over this many channels
+
+
+def _fraction(key: str) -> float:
+    """Stable pseudo-random value in [0, 1) for ``key``."""
+    return int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:8], 16) / 0x100000000
+
+
+def channel_for(video_id: str) -> str:
+    return f"UCstub{int(_fraction('ch:' + video_id) * CHANNEL_COUNT):018d}"
+
+
+def video_id_for(n: int) -> str:
+    """Deterministic 11-character video ID for the n-th synthetic stream."""
+    return f"v{n:010d}"
+
+
+class StubConfig:
+    def __init__(
+        self,
+        latency_ms: float = 50.0,
+        jitter_ms: float = 20.0,
+        error_rate: float = 0.0,
+        offline_rate: float = 0.1,
+        missing_rate: float = 0.02,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.offline_rate = offline_rate
+        self.missing_rate = missing_rate
+
+
+class YouTubeStub:
+    """Threaded HTTP server with request counters; usable as a context manager."""
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StubConfig()
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # ── lifecycle ───────────────────────────────────────────────────────
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "YouTubeStub":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "YouTubeStub":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+    # ── responses ───────────────────────────────────────────────────────
+
+    def videos_list(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        ids = [i for i in (query.get("id") or [""])[0].split(",") if i]
+        items = []
+        for video_id in ids[:50]:
+            if _fraction("missing:" + video_id) < self.config.missing_rate:
+                continue
+            live = video_id.startswith("alt") or _fraction("offline:" + video_id) >= self.config.offline_rate
+            items.append(
+                {
+                    "id": video_id,
+                    "snippet": {
+                        "title": f"Stub stream {video_id}",
+                        "channelId": channel_for(video_id),
+                        "channelTitle": f"Stub channel {channel_for(video_id)[-4:]}",
+                        "liveBroadcastContent": "live" if live else "none",
+                    },
+                }
+            )
+        return {"kind": "youtube#videoListResponse", "items": items}
+
+    def search_list(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        channel_id = (query.get("channelId") or [""])[0]
+        if _fraction("nolive:" + channel_id) < 0.5:
+            return {"kind": "youtube#searchListResponse", "items": []}
+        alt_id = "alt" + hashlib.sha256(channel_id.encode()).hexdigest()[:8]
+        return {"kind": "youtube#searchListResponse", "items": [{"id": {"videoId": alt_id}}]}
+
+    def oembed(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        url = (query.get("url") or [""])[0]
+        return {"title": f"Stub title for {url[-11:]}", "author_name": "Stub"}
+
+    def _handler_class(self):
+        stub = self
+        routes = {
+            "/youtube/v3/videos": ("videos.list", stub.videos_list),
+            "/youtube/v3/search": ("search.list", stub.search_list),
+            "/oembed": ("oembed", stub.oembed),
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                route = routes.get(parsed.path)
+                if route is None:
+                    self._send(404, {"error": {"code": 404, "message": "not found"}})
+                    return
+                name, handler = route
+                with stub._lock:
+                    stub.calls[name] += 1
+
+                cfg = stub.config
+                delay = max(0.0, random.gauss(cfg.latency_ms, cfg.jitter_ms)) / 1000
+                time.sleep(delay)
+                if random.random() < cfg.error_rate:
+                    self._send(503, {"error": {"code": 503, "message": "stub backend error", "errors": []}})
+                    return
+                self._send(200, handler(parse_qs(parsed.query)))
+
+            def _send(self, status: int, body: Dict[str, Any]) -> None:
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+
+# ── yt-dlp stand-in ─────────────────────────────────────────────────────────
+
+_VIDEO_ID_RE = re.compile(r"(?:v=|live/|youtu\.be/)([A-Za-z0-9_-]{11})")
+
+
+def fake_ytdlp(argv: List[str], latency_ms: float) -> int:
+    """Print a ``--dump-json`` style record for the URL at the end of ``argv``."""
+    time.sleep(latency_ms / 1000)
+    url = argv[-1] if argv else ""
+    match = _VIDEO_ID_RE.search(url)
+    video_id = match.group(1) if match else hashlib.sha256(url.encode()).hexdigest()[:11]
+    print(
+        json.dumps(
+            {
+                "id": video_id,
+                "title": f"Stub stream {video_id}",
+                "is_live": True,
+                "uploader": "Stub",
+                "channel_id": channel_for(video_id),
+                "channel_url": f"https://www.youtube.com/channel/{channel_for(video_id)}",
+            }
+        )
+    )
+    return 0
+
+
+def _parse_args(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="run the stub HTTP server")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency-ms", type=float, default=50.0)
+    serve.add_argument("--jitter-ms", type=float, default=20.0)
+    serve.add_argument("--error-rate", type=float, default=0.0)
+    serve.add_argument("--offline-rate", type=float, default=0.1)
+    ytdlp = sub.add_parser("ytdlp", help="emulate yt-dlp --dump-json")
+    ytdlp.add_argument("--latency-ms", type=float, default=300.0)
+    return parser.parse_known_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args, rest = _parse_args(argv)
+    if args.command == "ytdlp":
+        return fake_ytdlp(rest, args.latency_ms)
+
+    config = StubConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.offline_rate)
+    stub = YouTubeStub(config, args.host, args.port)
+    print(f"YouTube stub listening on {stub.base_url}")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+        print("Request counts:", dict(stub.calls))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))